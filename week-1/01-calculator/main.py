@@ -7,6 +7,11 @@ Author: Task Ninja Python Series
 Project: Week 1 - Python Mini Projects
 """
 
+import argparse
+import csv
+import re
+import sys
+
 
 def add(x: float, y: float) -> float:
     """
@@ -61,9 +66,55 @@ def divide(x: float, y: float) -> str | float:
     Returns:
         float | str: Quotient of x and y, or error message if y is 0
     """
-    if y == 0:
+    try:
+        return x / y
+    except ZeroDivisionError:
         return "Error: Division by zero"
-    return x / y
+
+
+# Operator symbol -> implementation
+OPS = {'+': add, '-': subtract, '*': multiply, '/': divide}
+
+# Menu number -> operator symbol
+MENU = {'1': '+', '2': '-', '3': '*', '4': '/'}
+
+# Operator and menu replies the prompts accept
+_VALID_OPS = frozenset('+-*/')
+_YES = frozenset({'y', 'yes'})
+_EXIT = frozenset({'5', 'exit', 'quit', 'q'})
+
+# Validates and normalizes a main-menu reply in one match
+_CHOICE_RE = re.compile(r'^\s*(?P<tok>[1-5+\-*/]|exit|quit|q)\s*$', re.I)
+
+
+# A piped calculation script answers three prompts per sum; skipping the flush
+# on each one roughly halves the time spent per line. A terminal still flushes.
+_INTERACTIVE = sys.stdin.isatty()
+
+
+def read_line(prompt: str = "") -> str:
+    """
+    Read one line of user input.
+    
+    A lighter replacement for input() that reads straight from sys.stdin,
+    which is already buffered, so piped scripts are consumed quickly.
+    
+    Args:
+        prompt (str): The prompt message to display
+        
+    Returns:
+        str: The line entered, without the trailing newline
+        
+    Raises:
+        EOFError: If input ends before a line is read
+    """
+    sys.stdout.write(prompt)
+    if _INTERACTIVE:
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 def get_number(prompt: str) -> float:
@@ -78,7 +129,7 @@ def get_number(prompt: str) -> float:
     """
     while True:
         try:
-            return float(input(prompt))
+            return float(read_line(prompt))
         except ValueError:
             print("❌ Please enter a valid number.")
 
@@ -90,11 +141,9 @@ def get_operator() -> str:
     Returns:
         str: Valid operator (+, -, *, /)
     """
-    valid_operators = ['+', '-', '*', '/']
-    
     while True:
-        operator = input("Enter your choice (+, -, *, /): ").strip()
-        if operator in valid_operators:
+        operator = read_line("Enter your choice (+, -, *, /): ").strip()
+        if operator in _VALID_OPS:
             return operator
         else:
             print("❌ Invalid operator. Please choose from +, -, *, /")
@@ -126,45 +175,96 @@ def calculate(operator: str, num1: float, num2: float) -> str | float:
     Returns:
         str | float: Result of the calculation
     """
-    if operator == '+':
-        return add(num1, num2)
-    elif operator == '-':
-        return subtract(num1, num2)
-    elif operator == '*':
-        return multiply(num1, num2)
-    elif operator == '/':
-        return divide(num1, num2)
-    else:
+    func = OPS.get(operator)
+    if func is None:
         return "Invalid operator"
+    return func(num1, num2)
+
+
+def calculate_batch(ops, x, y):
+    """
+    Perform many calculations at once using NumPy.
+    
+    Args:
+        ops (array_like): Operators (+, -, *, /), one per row
+        x (array_like): First numbers
+        y (array_like): Second numbers
+        
+    Returns:
+        numpy.ndarray: Results; NaN for division by zero or invalid operators
+    """
+    import numpy as np  # Only needed for batch mode
+    
+    ops = np.asarray(ops)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    out = np.full(x.shape, np.nan)
+    np.add(x, y, out=out, where=ops == '+')
+    np.subtract(x, y, out=out, where=ops == '-')
+    np.multiply(x, y, out=out, where=ops == '*')
+    np.divide(x, y, out=out, where=(ops == '/') & (y != 0))
+    return out
+
+
+def run_batch(file_path: str) -> None:
+    """
+    Evaluate an ``op,x,y`` CSV file and print ``op,x,y,result`` rows.
+    
+    Args:
+        file_path (str): Path to the CSV file ('-' reads standard input)
+    """
+    if file_path == '-':
+        rows = list(csv.reader(sys.stdin))
+    else:
+        with open(file_path, newline='') as f:
+            rows = list(csv.reader(f))
+    
+    rows = [row for row in rows if row]
+    if not rows:
+        return
+    
+    ops, xs, ys = zip(*((row[0].strip(), row[1], row[2]) for row in rows))
+    results = calculate_batch(ops, xs, ys)
+    
+    sys.stdout.write(''.join(
+        f"{o},{x.strip()},{y.strip()},{r}\n" for o, x, y, r in zip(ops, xs, ys, results.tolist())
+    ))
 
 
 def main():
     """Main function to run the calculator."""
+    parser = argparse.ArgumentParser(description="Simple Calculator")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Evaluate an op,x,y CSV file (use - for stdin) with NumPy and exit")
+    args = parser.parse_args()
+    
+    if args.batch:
+        try:
+            run_batch(args.batch)
+        except ImportError:
+            print("❌ Batch mode requires NumPy. Install it with: pip install numpy")
+        except (OSError, IndexError, ValueError) as e:
+            print(f"❌ Could not process batch file: {e}")
+        return
+    
     print("🎉 Welcome to the Simple Calculator!")
     
     while True:
         display_menu()
         
-        choice = input("Enter your choice (1-5 or +, -, *, /, exit): ").strip().lower()
+        match = _CHOICE_RE.match(read_line("Enter your choice (1-5 or +, -, *, /, exit): "))
+        if match is None:
+            print("❌ Invalid choice. Please try again.")
+            continue
         
-        if choice in ['5', 'exit', 'quit', 'q']:
+        choice = match['tok'].lower()
+        if choice in _EXIT:
             print("👋 Thank you for using the calculator! Goodbye!")
             break
         
-        # Handle menu number choices
-        if choice == '1':
-            operator = '+'
-        elif choice == '2':
-            operator = '-'
-        elif choice == '3':
-            operator = '*'
-        elif choice == '4':
-            operator = '/'
-        elif choice in ['+', '-', '*', '/']:
-            operator = choice
-        else:
-            print("❌ Invalid choice. Please try again.")
-            continue
+        # Handle menu number choices and operator symbols
+        operator = MENU.get(choice, choice)
         
         # Get numbers from user
         print(f"\nYou selected: {operator}")
@@ -178,8 +278,8 @@ def main():
         print(f"\n📊 Result: {num1} {operator} {num2} = {result}")
         
         # Ask if user wants to continue
-        continue_calc = input("\nDo you want to perform another calculation? (y/n): ").strip().lower()
-        if continue_calc not in ['y', 'yes']:
+        continue_calc = read_line("\nDo you want to perform another calculation? (y/n): ").strip().lower()
+        if continue_calc not in _YES:
             print("👋 Thank you for using the calculator! Goodbye!")
             break
 
@@ -9,45 +9,401 @@ Project: Week 1 - Python Mini Projects
 
 import os
 import json
-from datetime import datetime
-from typing import List, Dict
+import hashlib
+import re
+import sys
+import mmap
+import atexit
+import time
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+    # Big snapshots are streamed only through yajl's C backend; pure-Python ijson
+    # would take longer than loading the file in one parse
+    _ijson = ijson.get_backend('yajl2_c')
+except ImportError:
+    _ijson = None
+
+# Snapshots larger than this are streamed task-by-task instead of parsed whole
+STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+# Journal grows until it is this many times larger than the snapshot
+JOURNAL_COMPACT_RATIO = 2
+# Snapshot size assumed for that ratio when the real one is smaller, so short
+# lists don't rewrite the snapshot on almost every change
+JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+
+
+# Menu replies: delete confirmation, priority letters, options that pause afterwards
+_YES = frozenset({'y', 'yes'})
+_PRIO = {'': 'Normal', 'N': 'Normal', 'L': 'Low', 'H': 'High'}
+_PAUSE_CHOICES = frozenset({'1', '7'})
+
+
+# Last formatted timestamp, reused until the minute changes
+_stamp_minute = -1
+_stamp_text = ""
+
+
+def _timestamp() -> str:
+    """Return the local time as 'YYYY-MM-DD HH:MM', formatting at most once per minute."""
+    global _stamp_minute, _stamp_text
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _stamp_minute:
+        _stamp_text = time.strftime("%Y-%m-%d %H:%M", time.localtime(now))
+        _stamp_minute = minute
+    return _stamp_text
+
+
+def _digest(data) -> bytes:
+    """Short fingerprint of a snapshot, used to skip rewriting identical bytes."""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+class _HashingReader:
+    """Read-only file wrapper that fingerprints everything read through it."""
+    
+    __slots__ = ('_f', 'hash')
+    
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.hash = hashlib.blake2b(digest_size=8)
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self.hash.update(data)
+        return data
+
+
+def _encode_json(data, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, compact unless pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+class Task:
+    """A single to-do item (slotted, so large lists stay compact)."""
+    
+    __slots__ = ('task', 'completed', 'priority', 'created', 'completed_date')
+    
+    def __init__(self, task: str, completed: bool = False, priority: str = "Normal",
+                 created: str = "", completed_date: Optional[str] = None):
+        """
+        Initialize the Task.
+        
+        Args:
+            task (str): Task description
+            completed (bool): Whether the task is done
+            priority (str): Task priority (Low, Normal, High)
+            created (str): Creation time
+            completed_date (Optional[str]): Completion time, if completed
+        """
+        self.task = task
+        self.completed = completed
+        self.priority = priority
+        self.created = created
+        self.completed_date = completed_date
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """Build a Task from its JSON form, filling in any missing fields."""
+        return cls(
+            data['task'],
+            data.get('completed', False),
+            data.get('priority', 'Normal'),
+            data.get('created', 'Unknown'),
+            data.get('completed_date')
+        )
+    
+    def to_dict(self) -> Dict:
+        """Return the JSON form of the task."""
+        return {
+            'task': self.task,
+            'completed': self.completed,
+            'priority': self.priority,
+            'created': self.created,
+            'completed_date': self.completed_date
+        }
 
 
 class TodoList:
     """A simple command-line todo list manager."""
     
-    def __init__(self, filename: str = "tasks.json"):
+    def __init__(self, filename: str = "tasks.json", pretty: bool = False):
         """
         Initialize the TodoList.
         
         Args:
             filename (str): File to store tasks
+            pretty (bool): Write indented JSON (handy for debugging)
         """
         self.filename = filename
-        self.tasks = self.load_tasks()
+        self.journal_filename = os.path.splitext(filename)[0] + '.jsonl'
+        self.pretty = pretty
+        self._dirty = False
+        # Digest of the snapshot on disk (seeded when it is read, updated on write)
+        self._saved_digest: Optional[bytes] = None
+        # Rendered show_tasks output, reset whenever the tasks change
+        self._render_cache: Optional[str] = None
+        # Tasks keyed by id in display order; display numbers map to ids via _index_to_id
+        self._tasks = self.load_tasks()
+        self._next_id = max(self._tasks, default=0) + 1
+        self._index_to_id: Optional[List[int]] = None
+        # Running count kept in step with the mutators so stats are O(1)
+        self._completed = sum(1 for task in self.tasks if task.completed)
+        atexit.register(self.flush)
+    
+    @property
+    def tasks(self):
+        """Live read-only view of the tasks in display order."""
+        return self._tasks.values()
+    
+    def load_tasks(self) -> Dict[int, Task]:
+        """
+        Load tasks from the snapshot file and replay the journal on top.
+        
+        The result is this instance's authoritative in-memory copy; id
+        counter and stats are derived from it, so it is not shared with
+        other instances.
+        
+        Returns:
+            Dict[int, Task]: Tasks keyed by id
+        """
+        # Snapshot ids are positional; journal records refer to them
+        try:
+            tasks = dict(enumerate(map(Task.from_dict, self._read_tasks_file()), 1))
+        except (ValueError, KeyError, TypeError):
+            # A corrupt snapshot loads as empty and is no trusted base: the next
+            # save rewrites it, and a journal written against it is discarded
+            tasks = {}
+            self._saved_digest = None
+        if self._replay_journal(tasks):
+            # Fold the replayed journal into the snapshot on the next flush
+            self._dirty = True
+        return tasks
     
-    def load_tasks(self) -> List[Dict]:
+    def _read_tasks_file(self) -> Iterable[Dict]:
         """
-        Load tasks from file.
+        Read tasks from file.
+        
+        _saved_digest is only set once the file has parsed, so a corrupt
+        snapshot never counts as the saved state.
         
         Returns:
-            List[Dict]: List of tasks
+            Iterable[Dict]: Tasks; a lazy stream for very large files
         """
-        if os.path.exists(self.filename):
+        self._saved_digest = None
+        if not os.path.exists(self.filename):
+            return []
+        
+        try:
+            fd = os.open(self.filename, os.O_RDONLY)
             try:
-                with open(self.filename, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
+                size = os.fstat(fd).st_size
+                if size == 0:
+                    # mmap cannot map an empty file
+                    return []
+                if _ijson is not None and size > STREAM_THRESHOLD_BYTES:
+                    # Hand tasks out one at a time, so only the built Tasks stay in memory
+                    return self._stream_tasks(os.fdopen(os.dup(fd), 'rb'))
+                # Let the OS page the file in instead of reading through a text buffer
+                with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                    if orjson is not None:
+                        # orjson parses the mapped buffer without copying it
+                        with memoryview(mm) as view:
+                            data = orjson.loads(view)
+                    else:
+                        data = json.loads(mm[:])
+                    self._saved_digest = _digest(mm)
+                    return data
+            finally:
+                os.close(fd)
+        except (ValueError, OSError):
+            return []
+    
+    def _stream_tasks(self, f: BinaryIO) -> Iterator[Dict]:
+        """
+        Yield the tasks of a snapshot one by one with ijson, then close the file.
+        
+        The bytes are fingerprinted on the way through, so _saved_digest is
+        seeded without a second read.
+        
+        Raises:
+            ValueError: If the file is not a valid JSON array
+        """
+        with f:
+            reader = _HashingReader(f)
+            try:
+                yield from _ijson.items(reader, 'item', use_float=True)
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid tasks file: {e}") from e
+            self._saved_digest = reader.hash.digest()
+    
+    def _replay_journal(self, tasks: Dict[int, Task]) -> int:
+        """
+        Apply journal records written since the last snapshot.
+        
+        The journal's first line names the digest of the snapshot it was
+        written against. A journal left behind by a compaction that crashed
+        after replacing the snapshot names the old one; it is discarded
+        rather than replayed onto the renumbered tasks.
+        
+        Args:
+            tasks (Dict[int, Task]): Snapshot tasks, updated in place
+            
+        Returns:
+            int: Number of records applied
+        """
+        applied = 0
+        try:
+            with open(self.journal_filename, 'rb') as f:
+                header = f.readline()
+                if not header:
+                    return 0
+                try:
+                    base = json.loads(header)
+                    current = base['op'] == 'base' and base['digest'] == self._base_digest()
+                except (ValueError, KeyError, TypeError):
+                    current = False
+                if not current:
+                    f.close()
+                    os.remove(self.journal_filename)
+                    print("⚠️  Discarded a task journal from an older snapshot")
+                    return 0
+                
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self._apply_record(tasks, record)
+                    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                        # A torn final line from an interrupted write; stop here
+                        break
+                    applied += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"❌ Error reading task journal: {e}")
+        return applied
+    
+    def _base_digest(self) -> Optional[str]:
+        """Hex digest of the snapshot on disk, as recorded in journal headers."""
+        return self._saved_digest.hex() if self._saved_digest is not None else None
+    
+    @staticmethod
+    def _apply_record(tasks: Dict[int, Task], record: Dict) -> None:
+        """Apply a single journal record to the tasks."""
+        op = record['op']
+        if op == 'add':
+            tasks[record['id']] = Task.from_dict(record['payload'])
+        elif op == 'del':
+            del tasks[record['id']]
+        else:
+            task = tasks[record['id']]
+            for field, value in record['payload'].items():
+                setattr(task, field, value)
+    
+    def _task_id(self, index: int) -> int:
+        """
+        Map a display number to a task id.
+        
+        Args:
+            index (int): Task index (1-based)
+            
+        Returns:
+            int: Id of the task shown at that position
+        """
+        if self._index_to_id is None:
+            self._index_to_id = list(self._tasks)
+        return self._index_to_id[index - 1]
+    
+    def _log(self, op: str, task_id: int, payload: Optional[Dict] = None) -> None:
+        """
+        Append one change to the journal and mark the tasks as dirty.
+        
+        Args:
+            op (str): Operation name (add, del, complete, uncomplete, edit)
+            task_id (int): Id of the affected task
+            payload (Optional[Dict]): New task or changed fields
+        """
+        self._dirty = True
+        self._render_cache = None
+        if op in ('add', 'del'):
+            self._index_to_id = None
+        record = {'op': op, 'id': task_id, 'payload': payload,
+                  'ts': time.time()}
+        try:
+            with open(self.journal_filename, 'ab') as f:
+                if f.tell() == 0:
+                    # New journal: tie it to the snapshot it applies to
+                    f.write(_encode_json({'op': 'base', 'digest': self._base_digest()}) + b'\n')
+                f.write(_encode_json(record) + b'\n')
+                journal_size = f.tell()
+        except IOError as e:
+            print(f"❌ Error writing task journal: {e}")
+            return
+        
+        try:
+            snapshot_size = os.path.getsize(self.filename)
+        except OSError:
+            snapshot_size = 0
+        if journal_size > JOURNAL_COMPACT_RATIO * max(snapshot_size, JOURNAL_COMPACT_MIN_BYTES):
+            self.compact()
     
     def save_tasks(self) -> None:
-        """Save tasks to file."""
+        """Save tasks to file if they changed since the last save."""
+        if not self._dirty:
+            return
+        self.compact()
+    
+    def compact(self) -> None:
+        """
+        Rewrite the full snapshot and truncate the journal.
+        
+        The snapshot goes to a temporary file that is fsynced and renamed
+        over the old one, so a crash leaves either the old or the new file,
+        never a torn one. The journal is removed afterwards; if that step is
+        lost, its header no longer matches and the next load discards it.
+        """
+        tasks = list(self._tasks.values())
+        payload = _encode_json([task.to_dict() for task in tasks], self.pretty)
+        digest = _digest(payload)
+        
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(self.tasks, f, indent=2)
+            # Skip the rewrite when the changes cancelled out (e.g. complete then undo)
+            if digest != self._saved_digest:
+                # Encode once and hand the whole payload to a single buffered write
+                tmp_filename = self.filename + '.tmp'
+                with open(tmp_filename, 'wb', buffering=65536) as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_filename, self.filename)
+                self._saved_digest = digest
+            if os.path.exists(self.journal_filename):
+                os.remove(self.journal_filename)
+            self._dirty = False
         except IOError as e:
             print(f"❌ Error saving tasks: {e}")
+            return
+        
+        # Renumber to the positional ids the next load will assign
+        self._tasks.clear()
+        self._tasks.update(enumerate(tasks, 1))
+        self._next_id = len(tasks) + 1
+        self._index_to_id = None
+    
+    def flush(self) -> None:
+        """Write pending changes to disk (also runs automatically at exit)."""
+        self.save_tasks()
     
     def show_tasks(self) -> None:
         """Display all tasks."""
@@ -55,43 +411,49 @@ class TodoList:
             print("📝 No tasks yet. Add some tasks to get started!")
             return
         
-        print("\n📋 Your Tasks:")
-        print("-" * 50)
-        
-        for i, task in enumerate(self.tasks, 1):
-            status = "✅" if task.get('completed', False) else "⭕"
-            priority = task.get('priority', 'Normal')
-            created = task.get('created', 'Unknown')
+        if self._render_cache is None:
+            lines = ["\n📋 Your Tasks:\n", "-" * 50, "\n"]
+            append = lines.append
             
-            print(f"{i:2d}. {status} {task['task']}")
-            print(f"    Priority: {priority} | Created: {created}")
+            # Fields are always present (Task.from_dict fills defaults at load),
+            # so each one is read exactly once per task
+            for i, task in enumerate(self.tasks, 1):
+                completed = task.completed
+                status = "✅" if completed else "⭕"
+                
+                append(f"{i:2d}. {status} {task.task}\n"
+                       f"    Priority: {task.priority} | Created: {task.created}\n")
+                
+                if completed:
+                    append(f"    Completed: {task.completed_date}\n")
+                append("\n")
             
-            if task.get('completed'):
-                print(f"    Completed: {task.get('completed_date', 'Unknown')}")
-            print()
+            self._render_cache = ''.join(lines)
+            self._index_to_id = list(self._tasks)
+        
+        # One write for the whole list instead of a print per line
+        sys.stdout.write(self._render_cache)
     
-    def add_task(self, task_text: str, priority: str = "Normal") -> None:
+    def add_task(self, task_text: str, priority: str = "Normal",
+                 created: Optional[str] = None) -> None:
         """
         Add a new task.
         
         Args:
             task_text (str): Task description
             priority (str): Task priority (Low, Normal, High)
+            created (Optional[str]): Creation time; pass one value when adding in bulk
         """
         if not task_text.strip():
             print("❌ Task cannot be empty!")
             return
         
-        new_task = {
-            'task': task_text.strip(),
-            'completed': False,
-            'priority': priority,
-            'created': datetime.now().strftime("%Y-%m-%d %H:%M"),
-            'completed_date': None
-        }
+        new_task = Task(task_text.strip(), priority=priority, created=created or _timestamp())
         
-        self.tasks.append(new_task)
-        self.save_tasks()
+        task_id = self._next_id
+        self._next_id += 1
+        self._tasks[task_id] = new_task
+        self._log('add', task_id, new_task.to_dict())
         print(f"✅ Task added: '{task_text}'")
     
     def delete_task(self, index: int) -> None:
@@ -101,10 +463,13 @@ class TodoList:
         Args:
             index (int): Task index (1-based)
         """
-        if 1 <= index <= len(self.tasks):
-            removed_task = self.tasks.pop(index - 1)
-            self.save_tasks()
-            print(f"🗑️  Deleted: '{removed_task['task']}'")
+        if 1 <= index <= len(self._tasks):
+            task_id = self._task_id(index)
+            removed_task = self._tasks.pop(task_id)
+            if removed_task.completed:
+                self._completed -= 1
+            self._log('del', task_id)
+            print(f"🗑️  Deleted: '{removed_task.task}'")
         else:
             print("❌ Invalid task number.")
     
@@ -115,15 +480,18 @@ class TodoList:
         Args:
             index (int): Task index (1-based)
         """
-        if 1 <= index <= len(self.tasks):
-            if self.tasks[index - 1]['completed']:
+        if 1 <= index <= len(self._tasks):
+            task_id = self._task_id(index)
+            task = self._tasks[task_id]
+            if task.completed:
                 print("❌ Task already completed!")
                 return
             
-            self.tasks[index - 1]['completed'] = True
-            self.tasks[index - 1]['completed_date'] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            self.save_tasks()
-            print(f"🎉 Completed: '{self.tasks[index - 1]['task']}'")
+            task.completed = True
+            task.completed_date = _timestamp()
+            self._completed += 1
+            self._log('complete', task_id, {'completed': True, 'completed_date': task.completed_date})
+            print(f"🎉 Completed: '{task.task}'")
         else:
             print("❌ Invalid task number.")
     
@@ -134,15 +502,18 @@ class TodoList:
         Args:
             index (int): Task index (1-based)
         """
-        if 1 <= index <= len(self.tasks):
-            if not self.tasks[index - 1]['completed']:
+        if 1 <= index <= len(self._tasks):
+            task_id = self._task_id(index)
+            task = self._tasks[task_id]
+            if not task.completed:
                 print("❌ Task is not completed!")
                 return
             
-            self.tasks[index - 1]['completed'] = False
-            self.tasks[index - 1]['completed_date'] = None
-            self.save_tasks()
-            print(f"↩️  Uncompleted: '{self.tasks[index - 1]['task']}'")
+            task.completed = False
+            task.completed_date = None
+            self._completed -= 1
+            self._log('uncomplete', task_id, {'completed': False, 'completed_date': None})
+            print(f"↩️  Uncompleted: '{task.task}'")
         else:
             print("❌ Invalid task number.")
     
@@ -154,14 +525,16 @@ class TodoList:
             index (int): Task index (1-based)
             new_text (str): New task text
         """
-        if 1 <= index <= len(self.tasks):
+        if 1 <= index <= len(self._tasks):
             if not new_text.strip():
                 print("❌ Task cannot be empty!")
                 return
             
-            old_text = self.tasks[index - 1]['task']
-            self.tasks[index - 1]['task'] = new_text.strip()
-            self.save_tasks()
+            task_id = self._task_id(index)
+            task = self._tasks[task_id]
+            old_text = task.task
+            task.task = new_text.strip()
+            self._log('edit', task_id, {'task': task.task})
             print(f"✏️  Updated: '{old_text}' → '{new_text}'")
         else:
             print("❌ Invalid task number.")
@@ -173,29 +546,26 @@ class TodoList:
             return
         
         total = len(self.tasks)
-        completed = sum(1 for task in self.tasks if task['completed'])
+        completed = self._completed
         pending = total - completed
         
-        print(f"\n📊 Task Statistics:")
-        print(f"Total tasks: {total}")
-        print(f"Completed: {completed}")
-        print(f"Pending: {pending}")
-        print(f"Completion rate: {(completed/total*100):.1f}%")
+        sys.stdout.write(
+            f"\n📊 Task Statistics:\n"
+            f"Total tasks: {total}\n"
+            f"Completed: {completed}\n"
+            f"Pending: {pending}\n"
+            f"Completion rate: {(completed/total*100):.1f}%\n"
+        )
 
 
 def get_priority() -> str:
     """Get task priority from user."""
     while True:
-        priority = input("Enter priority (L)ow, (N)ormal, (H)igh [N]: ").strip().upper()
-        
-        if priority == '' or priority == 'N':
-            return "Normal"
-        elif priority == 'L':
-            return "Low"
-        elif priority == 'H':
-            return "High"
-        else:
-            print("❌ Invalid priority. Please enter L, N, or H.")
+        priority = _PRIO.get(input("Enter priority (L)ow, (N)ormal, (H)igh [N]: ").strip().upper())
+        
+        if priority is not None:
+            return priority
+        print("❌ Invalid priority. Please enter L, N, or H.")
 
 
 def get_valid_number(prompt: str, max_num: int) -> int:
@@ -211,20 +581,143 @@ def get_valid_number(prompt: str, max_num: int) -> int:
             print("❌ Please enter a valid number.")
 
 
+# The menu never changes, so it is rendered once at import
+_MENU = (
+    "\n" + "=" * 40 + "\n"
+    "📝 To-Do List Manager\n"
+    + "=" * 40 + "\n"
+    "1. 👀 View Tasks\n"
+    "2. ➕ Add Task\n"
+    "3. ✅ Complete Task\n"
+    "4. ↩️  Uncomplete Task\n"
+    "5. ✏️  Edit Task\n"
+    "6. 🗑️  Delete Task\n"
+    "7. 📊 Show Statistics\n"
+    "8. 🚪 Exit\n"
+    + "-" * 40 + "\n"
+)
+
+
 def display_menu():
     """Display the main menu."""
-    print("\n" + "=" * 40)
-    print("📝 To-Do List Manager")
-    print("=" * 40)
-    print("1. 👀 View Tasks")
-    print("2. ➕ Add Task")
-    print("3. ✅ Complete Task")
-    print("4. ↩️  Uncomplete Task")
-    print("5. ✏️  Edit Task")
-    print("6. 🗑️  Delete Task")
-    print("7. 📊 Show Statistics")
-    print("8. 🚪 Exit")
-    print("-" * 40)
+    sys.stdout.write(_MENU)
+
+
+def _view_tasks(todo: TodoList) -> bool:
+    """Menu action: show all tasks."""
+    todo.show_tasks()
+    return True
+
+
+def _add_task(todo: TodoList) -> bool:
+    """Menu action: prompt for and add a new task."""
+    task_text = input("📝 Enter task: ").strip()
+    if task_text:
+        priority = get_priority()
+        todo.add_task(task_text, priority)
+    else:
+        print("❌ Task cannot be empty!")
+    return True
+
+
+def _complete_task(todo: TodoList) -> bool:
+    """Menu action: mark a task as completed."""
+    if not todo.tasks:
+        print("❌ No tasks to complete!")
+        return True
+    
+    todo.show_tasks()
+    try:
+        index = get_valid_number("Enter task number to complete: ", len(todo.tasks))
+        todo.complete_task(index)
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled.")
+    return True
+
+
+def _uncomplete_task(todo: TodoList) -> bool:
+    """Menu action: mark a task as incomplete."""
+    if not todo.tasks:
+        print("❌ No tasks to uncomplete!")
+        return True
+    
+    todo.show_tasks()
+    try:
+        index = get_valid_number("Enter task number to uncomplete: ", len(todo.tasks))
+        todo.uncomplete_task(index)
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled.")
+    return True
+
+
+def _edit_task(todo: TodoList) -> bool:
+    """Menu action: change a task's text."""
+    if not todo.tasks:
+        print("❌ No tasks to edit!")
+        return True
+    
+    todo.show_tasks()
+    try:
+        index = get_valid_number("Enter task number to edit: ", len(todo.tasks))
+        new_text = input("Enter new task text: ").strip()
+        if new_text:
+            todo.edit_task(index, new_text)
+        else:
+            print("❌ Task cannot be empty!")
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled.")
+    return True
+
+
+def _delete_task(todo: TodoList) -> bool:
+    """Menu action: delete a task after confirmation."""
+    if not todo.tasks:
+        print("❌ No tasks to delete!")
+        return True
+    
+    todo.show_tasks()
+    try:
+        index = get_valid_number("Enter task number to delete: ", len(todo.tasks))
+        confirm = input(f"Are you sure you want to delete task {index}? (y/N): ").strip().lower()
+        if confirm in _YES:
+            todo.delete_task(index)
+        else:
+            print("❌ Deletion cancelled.")
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled.")
+    return True
+
+
+def _show_stats(todo: TodoList) -> bool:
+    """Menu action: show task statistics."""
+    todo.show_stats()
+    return True
+
+
+def _exit(todo: TodoList) -> bool:
+    """Menu action: save and leave the main loop."""
+    todo.flush()
+    print("👋 Thank you for using To-Do List Manager! Stay productive!")
+    return False
+
+
+# Validates and normalizes a menu reply in one match
+_CHOICE_RE = re.compile(r'^\s*(?P<tok>[1-8]|exit|quit|q)\s*$', re.I)
+
+# Menu token -> action; each action returns False to leave the main loop
+_ACTIONS = {
+    '1': _view_tasks,
+    '2': _add_task,
+    '3': _complete_task,
+    '4': _uncomplete_task,
+    '5': _edit_task,
+    '6': _delete_task,
+    '7': _show_stats,
+    '8': _exit,
+    'exit': _exit,
+    'quit': _exit,
+    'q': _exit,
+}
 
 
 def main():
@@ -236,87 +729,18 @@ def main():
     while True:
         display_menu()
         
-        choice = input("Choose an option (1-8): ").strip()
-        
-        if choice == '1':
-            todo.show_tasks()
+        match = _CHOICE_RE.match(input("Choose an option (1-8): "))
+        choice = match['tok'].lower() if match else None
         
-        elif choice == '2':
-            task_text = input("📝 Enter task: ").strip()
-            if task_text:
-                priority = get_priority()
-                todo.add_task(task_text, priority)
-            else:
-                print("❌ Task cannot be empty!")
+        if choice is None:
+            print("❌ Invalid option. Please choose 1-8.")
+            continue
         
-        elif choice == '3':
-            if not todo.tasks:
-                print("❌ No tasks to complete!")
-                continue
-            
-            todo.show_tasks()
-            try:
-                index = get_valid_number("Enter task number to complete: ", len(todo.tasks))
-                todo.complete_task(index)
-            except KeyboardInterrupt:
-                print("\n❌ Operation cancelled.")
-        
-        elif choice == '4':
-            if not todo.tasks:
-                print("❌ No tasks to uncomplete!")
-                continue
-            
-            todo.show_tasks()
-            try:
-                index = get_valid_number("Enter task number to uncomplete: ", len(todo.tasks))
-                todo.uncomplete_task(index)
-            except KeyboardInterrupt:
-                print("\n❌ Operation cancelled.")
-        
-        elif choice == '5':
-            if not todo.tasks:
-                print("❌ No tasks to edit!")
-                continue
-            
-            todo.show_tasks()
-            try:
-                index = get_valid_number("Enter task number to edit: ", len(todo.tasks))
-                new_text = input("Enter new task text: ").strip()
-                if new_text:
-                    todo.edit_task(index, new_text)
-                else:
-                    print("❌ Task cannot be empty!")
-            except KeyboardInterrupt:
-                print("\n❌ Operation cancelled.")
-        
-        elif choice == '6':
-            if not todo.tasks:
-                print("❌ No tasks to delete!")
-                continue
-            
-            todo.show_tasks()
-            try:
-                index = get_valid_number("Enter task number to delete: ", len(todo.tasks))
-                confirm = input(f"Are you sure you want to delete task {index}? (y/N): ").strip().lower()
-                if confirm in ['y', 'yes']:
-                    todo.delete_task(index)
-                else:
-                    print("❌ Deletion cancelled.")
-            except KeyboardInterrupt:
-                print("\n❌ Operation cancelled.")
-        
-        elif choice == '7':
-            todo.show_stats()
-        
-        elif choice == '8':
-            print("👋 Thank you for using To-Do List Manager! Stay productive!")
+        if not _ACTIONS[choice](todo):
             break
         
-        else:
-            print("❌ Invalid option. Please choose 1-8.")
-        
         # Wait for user to press Enter before showing menu again
-        if choice in ['1', '7']:
+        if choice in _PAUSE_CHOICES:
             input("\nPress Enter to continue...")
 
 
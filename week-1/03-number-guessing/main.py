@@ -7,8 +7,58 @@ Author: Task Ninja Python Series
 Project: Week 1 - Python Mini Projects
 """
 
+import argparse
 import random
-from typing import Optional
+from typing import List, Optional
+
+# Answers to the play-again prompt
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+# One shared generator for every game instead of going through the module-level helpers
+_RNG = random.Random()
+
+
+def _binary_search_attempts(secrets, min_number, max_number, out):
+    """Fill out[i] with the guesses a binary-search player needs for secrets[i]."""
+    for i in range(len(secrets)):
+        low = min_number
+        high = max_number
+        attempts = 0
+        while low <= high:
+            attempts += 1
+            guess = (low + high) // 2
+            if guess == secrets[i]:
+                break
+            if guess < secrets[i]:
+                low = guess + 1
+            else:
+                high = guess - 1
+        out[i] = attempts
+
+
+# Compiled batch kernel: None until first requested, False if numba is missing
+_batch_kernel = None
+
+
+def _get_batch_kernel():
+    """
+    Return the numba-compiled bot kernel, compiling it on first use.
+    
+    numba is only imported here, so interactive play never pays for it.
+    
+    Returns:
+        The compiled kernel, or None when numba is not installed
+    """
+    global _batch_kernel
+    if _batch_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # Optional JIT for bulk/bot play
+            _batch_kernel = False
+        else:
+            _batch_kernel = njit(cache=True)(_binary_search_attempts)
+    return _batch_kernel or None
 
 
 class NumberGuessingGame:
@@ -26,10 +76,12 @@ class NumberGuessingGame:
         self.min_number = min_number
         self.max_number = max_number
         self.max_attempts = max_attempts
-        self.secret_number = random.randint(min_number, max_number)
+        self.secret_number = _RNG.randint(min_number, max_number)
         self.attempts = 0
-        self.guesses = []
+        self.guesses: List[int] = []
         self.game_won = False
+        self.closest_guess: Optional[int] = None
+        self.closest_dist = float('inf')
     
     def make_guess(self, guess: int) -> str:
         """
@@ -41,8 +93,13 @@ class NumberGuessingGame:
         Returns:
             str: Feedback message
         """
-        self.attempts += 1
         self.guesses.append(guess)
+        self.attempts += 1
+        
+        distance = abs(guess - self.secret_number)
+        if distance < self.closest_dist:
+            self.closest_guess = guess
+            self.closest_dist = distance
         
         if guess == self.secret_number:
             self.game_won = True
@@ -60,6 +117,10 @@ class NumberGuessingGame:
         """Get remaining attempts."""
         return self.max_attempts - self.attempts
     
+    def get_guesses(self) -> List[int]:
+        """Get the guesses made so far, in order."""
+        return list(self.guesses)
+    
     def get_game_summary(self) -> str:
         """Get game summary."""
         if self.game_won:
@@ -68,6 +129,52 @@ class NumberGuessingGame:
             return f"😢 Game over! The number was {self.secret_number}."
 
 
+def play_batch(secrets, min_number: int = 1, max_number: int = 100):
+    """
+    Play many games with a binary-search bot.
+    
+    Args:
+        secrets (array_like): Secret numbers, one per game
+        min_number (int): Minimum number in range
+        max_number (int): Maximum number in range
+        
+    Returns:
+        numpy.ndarray | list: Attempts needed for each secret
+    """
+    kernel = _get_batch_kernel()
+    if kernel is None:
+        secrets = list(secrets)
+        out = [0] * len(secrets)
+        _binary_search_attempts(secrets, min_number, max_number, out)
+        return out
+    
+    import numpy as np  # numba always ships with numpy
+    secrets = np.asarray(secrets, dtype=np.int64)
+    out = np.zeros(len(secrets), dtype=np.int64)
+    kernel(secrets, min_number, max_number, out)
+    return out
+
+
+def run_bot(games: int, min_number: int = 1, max_number: int = 100, max_attempts: int = 7):
+    """
+    Let the binary-search bot play many games and print its statistics.
+    
+    Args:
+        games (int): Number of games to play
+        min_number (int): Minimum number in range
+        max_number (int): Maximum number in range
+        max_attempts (int): Attempts allowed per game
+    """
+    secrets = [_RNG.randint(min_number, max_number) for _ in range(games)]
+    attempts = [int(a) for a in play_batch(secrets, min_number, max_number)]
+    wins = sum(1 for a in attempts if a <= max_attempts)
+    
+    print(f"🤖 Bot played {games} games ({min_number}-{max_number}, {max_attempts} attempts)")
+    print(f"Games won: {wins}/{games}")
+    print(f"Average attempts: {sum(attempts) / games:.2f}")
+    print(f"Most attempts: {max(attempts)}")
+
+
 def get_difficulty_level() -> tuple:
     """
     Get difficulty level from user.
@@ -149,23 +256,22 @@ def play_game() -> bool:
             print(f"Attempts remaining: {remaining}")
             
             # Provide hints
-            if remaining <= 2 and len(game.guesses) > 1:
-                closest = min(game.guesses, key=lambda x: abs(x - game.secret_number))
-                print(f"💡 Hint: Your closest guess was {closest}")
+            if remaining <= 2 and game.attempts > 1:
+                print(f"💡 Hint: Your closest guess was {game.closest_guess}")
     
     # Game over
     print("\n" + "=" * 50)
     print(game.get_game_summary())
     
-    if game.guesses:
-        print(f"Your guesses: {', '.join(map(str, game.guesses))}")
+    if game.attempts:
+        print(f"Your guesses: {', '.join(map(str, game.get_guesses()))}")
     
     # Ask to play again
     while True:
         play_again = input("\nDo you want to play again? (y/n): ").strip().lower()
-        if play_again in ['y', 'yes']:
+        if play_again in _YES:
             return True
-        elif play_again in ['n', 'no']:
+        elif play_again in _NO:
             return False
         else:
             print("❌ Please enter 'y' for yes or 'n' for no.")
@@ -183,6 +289,17 @@ def show_game_rules():
 
 def main():
     """Main function to run the number guessing game."""
+    parser = argparse.ArgumentParser(description="Number Guessing Game")
+    parser.add_argument("--bot", metavar="GAMES", type=int,
+                        help="Let a binary-search bot play GAMES medium games and exit")
+    args = parser.parse_args()
+    
+    if args.bot is not None:
+        if args.bot < 1:
+            parser.error("--bot needs at least 1 game")
+        run_bot(args.bot)
+        return
+    
     print("🎮 Welcome to the Number Guessing Game!")
     print("=" * 50)
     
@@ -8,160 +8,213 @@ Project: Week 1 - Python Mini Projects
 """
 
 import sys
-from typing import Dict, Callable
+from types import MappingProxyType
+from typing import Dict
 
+# Arrays at least this large use the JIT kernel; smaller ones stay in NumPy
+JIT_MIN_SIZE = 10_000
 
-class UnitConverter:
-    """A comprehensive unit converter with multiple categories."""
-    
-    def __init__(self):
-        """Initialize the converter with all conversion functions."""
-        self.converters = {
-            'distance': {
-                'name': '📏 Distance',
-                'functions': {
-                    'km_to_miles': ('Kilometers to Miles', self.km_to_miles),
-                    'miles_to_km': ('Miles to Kilometers', self.miles_to_km),
-                    'km_to_feet': ('Kilometers to Feet', self.km_to_feet),
-                    'feet_to_km': ('Feet to Kilometers', self.feet_to_km),
-                    'm_to_feet': ('Meters to Feet', self.m_to_feet),
-                    'feet_to_m': ('Feet to Meters', self.feet_to_m),
-                }
-            },
-            'temperature': {
-                'name': '🌡️ Temperature', 
-                'functions': {
-                    'c_to_f': ('Celsius to Fahrenheit', self.c_to_f),
-                    'f_to_c': ('Fahrenheit to Celsius', self.f_to_c),
-                    'c_to_k': ('Celsius to Kelvin', self.c_to_k),
-                    'k_to_c': ('Kelvin to Celsius', self.k_to_c),
-                    'f_to_k': ('Fahrenheit to Kelvin', self.f_to_k),
-                    'k_to_f': ('Kelvin to Fahrenheit', self.k_to_f),
-                }
-            },
-            'weight': {
-                'name': '⚖️ Weight',
-                'functions': {
-                    'kg_to_lb': ('Kilograms to Pounds', self.kg_to_lb),
-                    'lb_to_kg': ('Pounds to Kilograms', self.lb_to_kg),
-                    'kg_to_oz': ('Kilograms to Ounces', self.kg_to_oz),
-                    'oz_to_kg': ('Ounces to Kilograms', self.oz_to_kg),
-                    'g_to_oz': ('Grams to Ounces', self.g_to_oz),
-                    'oz_to_g': ('Ounces to Grams', self.oz_to_g),
-                }
-            },
-            'volume': {
-                'name': '🥤 Volume',
-                'functions': {
-                    'l_to_gal': ('Liters to Gallons', self.l_to_gal),
-                    'gal_to_l': ('Gallons to Liters', self.gal_to_l),
-                    'l_to_cups': ('Liters to Cups', self.l_to_cups),
-                    'cups_to_l': ('Cups to Liters', self.cups_to_l),
-                    'ml_to_oz': ('Milliliters to Fluid Ounces', self.ml_to_oz),
-                    'oz_to_ml': ('Fluid Ounces to Milliliters', self.oz_to_ml),
-                }
-            }
-        }
-    
-    # Distance conversions
-    def km_to_miles(self, km: float) -> float:
-        """Convert kilometers to miles."""
-        return km * 0.621371
-    
-    def miles_to_km(self, miles: float) -> float:
-        """Convert miles to kilometers."""
-        return miles / 0.621371
-    
-    def km_to_feet(self, km: float) -> float:
-        """Convert kilometers to feet."""
-        return km * 3280.84
-    
-    def feet_to_km(self, feet: float) -> float:
-        """Convert feet to kilometers."""
-        return feet / 3280.84
-    
-    def m_to_feet(self, meters: float) -> float:
-        """Convert meters to feet."""
-        return meters * 3.28084
-    
-    def feet_to_m(self, feet: float) -> float:
-        """Convert feet to meters."""
-        return feet / 3.28084
-    
-    # Temperature conversions
-    def c_to_f(self, celsius: float) -> float:
-        """Convert Celsius to Fahrenheit."""
-        return (celsius * 9/5) + 32
-    
-    def f_to_c(self, fahrenheit: float) -> float:
-        """Convert Fahrenheit to Celsius."""
-        return (fahrenheit - 32) * 5/9
-    
-    def c_to_k(self, celsius: float) -> float:
-        """Convert Celsius to Kelvin."""
-        return celsius + 273.15
-    
-    def k_to_c(self, kelvin: float) -> float:
-        """Convert Kelvin to Celsius."""
-        return kelvin - 273.15
-    
-    def f_to_k(self, fahrenheit: float) -> float:
-        """Convert Fahrenheit to Kelvin."""
-        return self.c_to_k(self.f_to_c(fahrenheit))
-    
-    def k_to_f(self, kelvin: float) -> float:
-        """Convert Kelvin to Fahrenheit."""
-        return self.c_to_f(self.k_to_c(kelvin))
-    
-    # Weight conversions
-    def kg_to_lb(self, kg: float) -> float:
-        """Convert kilograms to pounds."""
-        return kg * 2.20462
-    
-    def lb_to_kg(self, lb: float) -> float:
-        """Convert pounds to kilograms."""
-        return lb / 2.20462
-    
-    def kg_to_oz(self, kg: float) -> float:
-        """Convert kilograms to ounces."""
-        return kg * 35.274
-    
-    def oz_to_kg(self, oz: float) -> float:
-        """Convert ounces to kilograms."""
-        return oz / 35.274
-    
-    def g_to_oz(self, grams: float) -> float:
-        """Convert grams to ounces."""
-        return grams * 0.035274
-    
-    def oz_to_g(self, oz: float) -> float:
-        """Convert ounces to grams."""
-        return oz / 0.035274
-    
-    # Volume conversions
-    def l_to_gal(self, liters: float) -> float:
-        """Convert liters to gallons (US)."""
-        return liters * 0.264172
-    
-    def gal_to_l(self, gallons: float) -> float:
-        """Convert gallons (US) to liters."""
-        return gallons / 0.264172
+# Numba kernel for convert_array: None until first needed, False without numba
+_affine = None
+
+
+def _affine_kernel():
+    """
+    Return the parallel numba kernel, compiling it on first use.
     
-    def l_to_cups(self, liters: float) -> float:
-        """Convert liters to cups (US)."""
-        return liters * 4.22675
+    numba is only imported here, so the interactive CLI never pays for it.
     
-    def cups_to_l(self, cups: float) -> float:
-        """Convert cups (US) to liters."""
-        return cups / 4.22675
+    Returns:
+        The kernel, or None when numba is not installed
+    """
+    global _affine
+    if _affine is None:
+        try:
+            from numba import njit, prange
+        except ImportError:  # Optional JIT kernel for very large array conversions
+            _affine = False
+        else:
+            @njit(cache=True, parallel=True)
+            def kernel(values, scale, offset, out):
+                """Compute out = values * scale + offset across all cores."""
+                for i in prange(values.shape[0]):
+                    out[i] = values[i] * scale + offset
+            
+            _affine = kernel
+    return _affine or None
+
+
+# Reciprocals of the forward factors, so reverse conversions multiply
+_KM_PER_MILE = 1 / 0.621371
+_KM_PER_FOOT = 1 / 3280.84
+_M_PER_FOOT = 1 / 3.28084
+_KG_PER_LB = 1 / 2.20462
+_KG_PER_OZ = 1 / 35.274
+_G_PER_OZ = 1 / 0.035274
+_L_PER_GAL = 1 / 0.264172
+_L_PER_CUP = 1 / 4.22675
+_ML_PER_OZ = 1 / 0.033814
+
+# Fahrenheit <-> Kelvin folded into a single multiply-add
+_F_TO_K_OFF = 273.15 - 32 * 5 / 9
+_K_TO_F_OFF = 32 - 273.15 * 9 / 5
+
+
+# Every conversion is affine: result = value * scale + offset.
+# Chained conversions (e.g. F -> C -> K) are folded into one pair here.
+_FACTORS = MappingProxyType({
+    'km_to_miles': (0.621371, 0.0),
+    'miles_to_km': (_KM_PER_MILE, 0.0),
+    'km_to_feet': (3280.84, 0.0),
+    'feet_to_km': (_KM_PER_FOOT, 0.0),
+    'm_to_feet': (3.28084, 0.0),
+    'feet_to_m': (_M_PER_FOOT, 0.0),
+    'c_to_f': (9 / 5, 32.0),
+    'f_to_c': (5 / 9, -32 * 5 / 9),
+    'c_to_k': (1.0, 273.15),
+    'k_to_c': (1.0, -273.15),
+    'f_to_k': (5 / 9, _F_TO_K_OFF),
+    'k_to_f': (9 / 5, _K_TO_F_OFF),
+    'kg_to_lb': (2.20462, 0.0),
+    'lb_to_kg': (_KG_PER_LB, 0.0),
+    'kg_to_oz': (35.274, 0.0),
+    'oz_to_kg': (_KG_PER_OZ, 0.0),
+    'g_to_oz': (0.035274, 0.0),
+    'oz_to_g': (_G_PER_OZ, 0.0),
+    'l_to_gal': (0.264172, 0.0),
+    'gal_to_l': (_L_PER_GAL, 0.0),
+    'l_to_cups': (4.22675, 0.0),
+    'cups_to_l': (_L_PER_CUP, 0.0),
+    'ml_to_oz': (0.033814, 0.0),
+    'oz_to_ml': (_ML_PER_OZ, 0.0),
+})
+
+# Menu categories; entries map to (display name, conversion key).
+# Built once at import and shared read-only by every UnitConverter.
+_CONVERTERS = MappingProxyType({
+    'distance': {
+        'name': '📏 Distance',
+        'functions': {
+            'km_to_miles': ('Kilometers to Miles', 'km_to_miles'),
+            'miles_to_km': ('Miles to Kilometers', 'miles_to_km'),
+            'km_to_feet': ('Kilometers to Feet', 'km_to_feet'),
+            'feet_to_km': ('Feet to Kilometers', 'feet_to_km'),
+            'm_to_feet': ('Meters to Feet', 'm_to_feet'),
+            'feet_to_m': ('Feet to Meters', 'feet_to_m'),
+        }
+    },
+    'temperature': {
+        'name': '🌡️ Temperature', 
+        'functions': {
+            'c_to_f': ('Celsius to Fahrenheit', 'c_to_f'),
+            'f_to_c': ('Fahrenheit to Celsius', 'f_to_c'),
+            'c_to_k': ('Celsius to Kelvin', 'c_to_k'),
+            'k_to_c': ('Kelvin to Celsius', 'k_to_c'),
+            'f_to_k': ('Fahrenheit to Kelvin', 'f_to_k'),
+            'k_to_f': ('Kelvin to Fahrenheit', 'k_to_f'),
+        }
+    },
+    'weight': {
+        'name': '⚖️ Weight',
+        'functions': {
+            'kg_to_lb': ('Kilograms to Pounds', 'kg_to_lb'),
+            'lb_to_kg': ('Pounds to Kilograms', 'lb_to_kg'),
+            'kg_to_oz': ('Kilograms to Ounces', 'kg_to_oz'),
+            'oz_to_kg': ('Ounces to Kilograms', 'oz_to_kg'),
+            'g_to_oz': ('Grams to Ounces', 'g_to_oz'),
+            'oz_to_g': ('Ounces to Grams', 'oz_to_g'),
+        }
+    },
+    'volume': {
+        'name': '🥤 Volume',
+        'functions': {
+            'l_to_gal': ('Liters to Gallons', 'l_to_gal'),
+            'gal_to_l': ('Gallons to Liters', 'gal_to_l'),
+            'l_to_cups': ('Liters to Cups', 'l_to_cups'),
+            'cups_to_l': ('Cups to Liters', 'cups_to_l'),
+            'ml_to_oz': ('Milliliters to Fluid Ounces', 'ml_to_oz'),
+            'oz_to_ml': ('Fluid Ounces to Milliliters', 'oz_to_ml'),
+        }
+    }
+})
+
+# Each category's options frozen into a tuple once (keyed by display name),
+# so menus never rebuild it; kept apart so _CONVERTERS stays untouched
+_ITEMS = MappingProxyType({
+    category_data['name']: tuple(category_data['functions'].items())
+    for category_data in _CONVERTERS.values()
+})
+
+# Main menu choice -> category, and (category, option number) -> (display name, key)
+_CATEGORY_BY_CHOICE = MappingProxyType({
+    '1': 'distance',
+    '2': 'temperature',
+    '3': 'weight',
+    '4': 'volume',
+})
+_MENU = MappingProxyType({
+    (category, i): entry
+    for category, category_data in _CONVERTERS.items()
+    for i, (_, entry) in enumerate(_ITEMS[category_data['name']], 1)
+})
+
+
+class UnitConverter:
+    """A comprehensive unit converter with multiple categories."""
     
-    def ml_to_oz(self, ml: float) -> float:
-        """Convert milliliters to fluid ounces."""
-        return ml * 0.033814
+    factors = _FACTORS
+    converters = _CONVERTERS
     
-    def oz_to_ml(self, oz: float) -> float:
-        """Convert fluid ounces to milliliters."""
-        return oz / 0.033814
+    def convert(self, key: str, value: float) -> float:
+        """
+        Convert a value using a conversion key.
+        
+        Args:
+            key (str): Conversion key, e.g. 'km_to_miles'
+            value (float): Value to convert
+            
+        Returns:
+            float: Converted value
+        """
+        scale, offset = self.factors[key]
+        return value * scale + offset
+    
+    def convert_array(self, key: str, values):
+        """
+        Convert many values at once with NumPy.
+        
+        Args:
+            key (str): Conversion key, e.g. 'km_to_miles'
+            values (array_like): Values to convert
+            
+        Returns:
+            numpy.ndarray: Converted values as float64
+        """
+        import numpy as np  # Only needed for batch conversions
+        
+        scale, offset = self.factors[key]
+        values = np.asarray(values, dtype=np.float64)
+        
+        kernel = _affine_kernel() if values.ndim == 1 and values.size >= JIT_MIN_SIZE else None
+        if kernel is not None:
+            out = np.empty_like(values)
+            kernel(values, scale, offset, out)
+            return out
+        
+        out = np.multiply(values, scale)
+        if offset:
+            np.add(out, offset, out=out)
+        return out
+
+
+def format_result(value: float, digits: int) -> str:
+    """
+    Format a converted value to a fixed number of decimals.
+    
+    The value is rounded first, so float noise such as -2.8e-14 prints
+    as 0.0000 rather than -0.0000.
+    """
+    return f"{round(value, digits) + 0.0:.{digits}f}"
 
 
 def get_valid_number(prompt: str) -> float:
@@ -173,37 +226,54 @@ def get_valid_number(prompt: str) -> float:
             print("❌ Please enter a valid number.")
 
 
+# The main menu never changes, so it is rendered once at import
+_MAIN_MENU = (
+    "\n" + "=" * 40 + "\n"
+    "🌍 Unit Converter\n"
+    + "=" * 40 + "\n"
+    "Select conversion category:\n"
+    "1. 📏 Distance (km, miles, feet, meters)\n"
+    "2. 🌡️  Temperature (Celsius, Fahrenheit, Kelvin)\n"
+    "3. ⚖️  Weight (kg, pounds, ounces, grams)\n"
+    "4. 🥤 Volume (liters, gallons, cups, ml)\n"
+    "5. 🔄 Quick Convert (original simplified)\n"
+    "6. 🚪 Exit\n"
+    + "-" * 40 + "\n"
+)
+
+# Rendered category menus, keyed by category name
+_CATEGORY_MENU_CACHE: Dict[str, str] = {}
+
+
 def display_main_menu():
     """Display the main category menu."""
-    print("\n" + "=" * 40)
-    print("🌍 Unit Converter")
-    print("=" * 40)
-    print("Select conversion category:")
-    print("1. 📏 Distance (km, miles, feet, meters)")
-    print("2. 🌡️  Temperature (Celsius, Fahrenheit, Kelvin)")
-    print("3. ⚖️  Weight (kg, pounds, ounces, grams)")
-    print("4. 🥤 Volume (liters, gallons, cups, ml)")
-    print("5. 🔄 Quick Convert (original simplified)")
-    print("6. 🚪 Exit")
-    print("-" * 40)
-
-
-def display_category_menu(category_data: Dict) -> Dict:
+    sys.stdout.write(_MAIN_MENU)
+
+
+def display_category_menu(category_data: Dict) -> tuple:
     """Display conversion options for a category."""
-    print(f"\n{category_data['name']} Converter")
-    print("-" * 30)
-    
-    functions = list(category_data['functions'].items())
-    for i, (key, (name, func)) in enumerate(functions, 1):
-        print(f"{i}. {name}")
-    
-    print(f"{len(functions) + 1}. ← Back to main menu")
+    functions = _ITEMS[category_data['name']]
+    text = _CATEGORY_MENU_CACHE.get(category_data['name'])
+    if text is None:
+        lines = [f"\n{category_data['name']} Converter\n", "-" * 30 + "\n"]
+        for i, (key, (name, conversion_key)) in enumerate(functions, 1):
+            lines.append(f"{i}. {name}\n")
+        lines.append(f"{len(functions) + 1}. ← Back to main menu\n")
+        
+        text = ''.join(lines)
+        _CATEGORY_MENU_CACHE[category_data['name']] = text
     
+    sys.stdout.write(text)
     return functions
 
 
-def quick_convert():
-    """Simple converter matching the original code."""
+def quick_convert(converter: UnitConverter):
+    """
+    Simple converter matching the original code.
+    
+    Args:
+        converter (UnitConverter): Converter shared with the main menu
+    """
     print("\n🌍 Unit Converter (Quick Mode)")
     print("1. Kilometers to Miles")
     print("2. Miles to Kilometers") 
@@ -212,25 +282,23 @@ def quick_convert():
     
     choice = input("Choose conversion (1-4): ")
     
-    converter = UnitConverter()
-    
     try:
         if choice == '1':
             km = get_valid_number("Enter kilometers: ")
-            result = converter.km_to_miles(km)
-            print(f"{km} km = {result:.2f} miles")
+            result = converter.convert('km_to_miles', km)
+            print(f"{km} km = {format_result(result, 2)} miles")
         elif choice == '2':
             miles = get_valid_number("Enter miles: ")
-            result = converter.miles_to_km(miles)
-            print(f"{miles} miles = {result:.2f} km")
+            result = converter.convert('miles_to_km', miles)
+            print(f"{miles} miles = {format_result(result, 2)} km")
         elif choice == '3':
             c = get_valid_number("Enter Celsius: ")
-            result = converter.c_to_f(c)
-            print(f"{c}°C = {result:.2f}°F")
+            result = converter.convert('c_to_f', c)
+            print(f"{c}°C = {format_result(result, 2)}°F")
         elif choice == '4':
             f = get_valid_number("Enter Fahrenheit: ")
-            result = converter.f_to_c(f)
-            print(f"{f}°F = {result:.2f}°C")
+            result = converter.convert('f_to_c', f)
+            print(f"{f}°F = {format_result(result, 2)}°C")
         else:
             print("❌ Invalid choice.")
     except Exception as e:
@@ -252,17 +320,10 @@ def main():
             print("👋 Thank you for using the Unit Converter! Goodbye!")
             break
         elif choice == '5':
-            quick_convert()
+            quick_convert(converter)
             continue
-        elif choice in ['1', '2', '3', '4']:
-            category_map = {
-                '1': 'distance',
-                '2': 'temperature', 
-                '3': 'weight',
-                '4': 'volume'
-            }
-            
-            category = category_map[choice]
+        elif choice in _CATEGORY_BY_CHOICE:
+            category = _CATEGORY_BY_CHOICE[choice]
             category_data = converter.converters[category]
             
             while True:
@@ -271,20 +332,22 @@ def main():
                 try:
                     sub_choice = int(input(f"Enter choice (1-{len(functions) + 1}): "))
                     
+                    entry = _MENU.get((category, sub_choice))
+                    
                     if sub_choice == len(functions) + 1:
                         break  # Back to main menu
-                    elif 1 <= sub_choice <= len(functions):
-                        func_key, (func_name, func) = functions[sub_choice - 1]
+                    elif entry is not None:
+                        func_name, conversion_key = entry
                         
                         # Get input value
                         input_prompt = f"Enter value to convert: "
                         value = get_valid_number(input_prompt)
                         
                         # Perform conversion
-                        result = func(value)
+                        result = converter.convert(conversion_key, value)
                         
                         # Display result
-                        print(f"✅ {func_name}: {value} = {result:.4f}")
+                        print(f"✅ {func_name}: {value} = {format_result(result, 4)}")
                         
                         # Ask if user wants to continue
                         continue_choice = input("\nContinue with this category? (y/n): ").strip().lower()
@@ -10,7 +10,6 @@ Project: Week 1 - Python Mini Projects
 import sys
 import time
 import argparse
-from datetime import datetime
 from typing import Optional
 
 try:
@@ -41,6 +40,11 @@ class DigitalClock:
         self.font_family = "Helvetica"
         self.font_size = 40
         
+        # Last rendered second and calendar day, so ticks only redo what changed
+        self._last_sec = -1
+        self._date_day = None
+        self._date_text = ""
+        
         if not cli_mode and GUI_AVAILABLE:
             self.setup_gui()
     
@@ -78,6 +82,13 @@ class DigitalClock:
             relief='flat'
         )
         self.date_label.pack()
+        self._date_packed = True
+        
+        # Raw Tcl handles so per-tick text updates skip Label.config's option parsing
+        self._tk_call = self.app.tk.call
+        self._clock_path = str(self.clock_label)
+        self._date_path = str(self.date_label)
+        self._shown_date = None
         
         # Control buttons frame
         self.controls_frame = Frame(self.app, bg=self.bg_color)
@@ -96,48 +107,86 @@ class DigitalClock:
         # Start the clock
         self.update_gui_time()
     
-    def get_current_time(self) -> str:
-        """Get current time as formatted string."""
-        now = datetime.now()
+    def format_time(self, tm: time.struct_time) -> str:
+        """
+        Format a local time with plain integer formatting (no strftime).
         
+        Args:
+            tm (time.struct_time): Local time to format
+            
+        Returns:
+            str: Time as HH:MM:SS, or hh:MM:SS AM/PM in 12-hour mode
+        """
         if self.format_24h:
-            time_str = now.strftime("%H:%M:%S")
-        else:
-            time_str = now.strftime("%I:%M:%S %p")
+            return f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
         
-        return time_str
+        hour = tm.tm_hour % 12 or 12
+        suffix = "AM" if tm.tm_hour < 12 else "PM"
+        return f"{hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d} {suffix}"
     
-    def get_current_date(self) -> str:
-        """Get current date as formatted string."""
-        now = datetime.now()
-        return now.strftime("%A, %B %d, %Y")
+    def get_current_time(self) -> str:
+        """Get current time as formatted string."""
+        return self.format_time(time.localtime())
+    
+    def get_current_date(self, tm: Optional[time.struct_time] = None) -> str:
+        """
+        Get current date as formatted string, reformatting at most once a day.
+        
+        Args:
+            tm (time.struct_time, optional): Local time to use; defaults to now
+            
+        Returns:
+            str: Date such as "Monday, January 01, 2024"
+        """
+        if tm is None:
+            tm = time.localtime()
+        
+        # Keyed on the local calendar day so the text flips at local midnight
+        day = (tm.tm_year, tm.tm_yday)
+        if day != self._date_day:
+            self._date_day = day
+            self._date_text = time.strftime("%A, %B %d, %Y", tm)
+        return self._date_text
     
     def update_gui_time(self):
         """Update the GUI clock display."""
         if not self.running:
             return
         
-        current_time = self.get_current_time()
-        self.clock_label.config(text=current_time)
+        now = time.time()
+        sec = int(now)
         
-        if self.show_date:
-            current_date = self.get_current_date()
-            self.date_label.config(text=current_date)
-            self.date_label.pack()
-        else:
-            self.date_label.pack_forget()
+        if sec != self._last_sec:
+            self._last_sec = sec
+            tm = time.localtime(sec)
+            self._tk_call(self._clock_path, 'configure', '-text', self.format_time(tm))
+            
+            if self.show_date:
+                date_text = self.get_current_date(tm)
+                if date_text != self._shown_date:
+                    self._tk_call(self._date_path, 'configure', '-text', date_text)
+                    self._shown_date = date_text
+                if not self._date_packed:
+                    self.date_label.pack()
+                    self._date_packed = True
+            elif self._date_packed:
+                self.date_label.pack_forget()
+                self._date_packed = False
         
-        # Schedule next update
-        self.clock_label.after(1000, self.update_gui_time)
+        # Schedule the next update just after the next whole second to avoid drift
+        delay = 1000 - int((now % 1) * 1000)
+        self.clock_label.after(max(delay, 1), self.update_gui_time)
     
     def toggle_format(self):
         """Toggle between 12h and 24h format."""
         self.format_24h = not self.format_24h
+        self._last_sec = -1  # Re-render on the next tick
         print(f"⏰ Switched to {'24-hour' if self.format_24h else '12-hour'} format")
     
     def toggle_date(self):
         """Toggle date display."""
         self.show_date = not self.show_date
+        self._last_sec = -1  # Re-render on the next tick
         print(f"📅 Date display {'enabled' if self.show_date else 'disabled'}")
     
     def change_colors(self):
@@ -214,22 +263,25 @@ class DigitalClock:
         print("-" * 40)
         
         try:
+            # Clear the screen once; each frame then redraws in place from the top
+            sys.stdout.write("\033[2J")
+            
             while self.running:
-                # Clear screen (works on most terminals)
-                print("\033[2J\033[H", end="")
-                
                 # Display clock
-                current_time = self.get_current_time()
-                print(f"\n{'':>15}🕒 {current_time}")
+                lines = ["", f"{'':>15}🕒 {self.get_current_time()}"]
                 
                 if self.show_date:
-                    current_date = self.get_current_date()
-                    print(f"{'':>10}{current_date}")
+                    lines.append(f"{'':>10}{self.get_current_date()}")
+                
+                lines.append("")
+                lines.append(f"{'':>15}Press Ctrl+C to exit")
                 
-                print(f"\n{'':>15}Press Ctrl+C to exit")
+                # Cursor home, then overwrite each line and erase whatever is left of it
+                sys.stdout.write("\033[H" + "".join(line + "\033[K\n" for line in lines))
+                sys.stdout.flush()
                 
-                # Wait for 1 second
-                time.sleep(1)
+                # Sleep until the next whole second so no second is skipped
+                time.sleep(1 - (time.time() % 1))
                 
         except KeyboardInterrupt:
             print("\n\n👋 Digital Clock stopped. Goodbye!")
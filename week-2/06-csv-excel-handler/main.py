@@ -8,10 +8,125 @@ Project: Week 2 - Data Handling & APIs
 """
 
 import pandas as pd
+import contextlib
+import datetime
+import json
 import os
 import sys
+from collections import OrderedDict
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
+
+try:
+    import python_calamine  # noqa: F401  (Rust reader, used through pandas)
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_READ_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except (ImportError, ValueError):  # Optional: pandas' default reader is used instead
+    EXCEL_READ_ENGINE = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional: multi-threaded CSV parsing and writing
+    pa_csv = None
+
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:  # Optional: fused median fill for float columns in clean_data
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _median_fill(values):
+        """Return a copy of a float64 array with NaNs replaced by its median."""
+        n = values.shape[0]
+        valid = np.empty(n)
+        count = 0
+        for i in range(n):
+            if not np.isnan(values[i]):
+                valid[count] = values[i]
+                count += 1
+        if count == 0:
+            return values.copy()
+        
+        # Quickselect instead of a full sort
+        mid = count // 2
+        part = np.partition(valid[:count], mid)
+        median = part[mid] if count % 2 else (part[:mid].max() + part[mid]) / 2
+        
+        out = np.empty(n)
+        for i in prange(n):
+            out[i] = median if np.isnan(values[i]) else values[i]
+        return out
+else:
+    _median_fill = None
+
+# 1 MiB file buffers instead of the 8 KiB default, for far fewer syscalls
+IO_BUFFER_SIZE = 1 << 20
+
+# File name endings pandas infers a compression from (only when given the path)
+_COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.zip', '.xz', '.zst', '.tar')
+
+# Default rows per chunk for iter_csv
+CSV_CHUNK_ROWS = 100_000
+
+# Frames using more memory than this get a usecols hint in display_data_info
+USECOLS_HINT_BYTES = 100 * 1024 * 1024
+
+# CSV inputs larger than this get a Parquet suggestion before Excel conversion
+PARQUET_HINT_BYTES = 50 * 1024 * 1024
+
+# Most workbooks kept open for reuse (least recently used are closed first)
+EXCEL_FILE_CACHE_SIZE = 4
+
+
+def _open_buffered(path: str, mode: str = 'rb'):
+    """Open a binary file with a large buffer for pandas/openpyxl to use."""
+    return open(path, mode, buffering=IO_BUFFER_SIZE)
+
+
+def _open_csv(path: str, mode: str = 'rb'):
+    """
+    Open a CSV file for pandas with a large buffer.
+    
+    Compressed files (.gz, .zip, ...) are handed to pandas by path instead,
+    since it only infers the compression from the file name.
+    """
+    if str(path).lower().endswith(_COMPRESSED_SUFFIXES):
+        return contextlib.nullcontext(path)
+    return _open_buffered(path, mode)
+
+
+def _excel_rows(data: pd.DataFrame) -> Iterator[Tuple]:
+    """
+    Yield DataFrame rows as plain tuples ready for a worksheet.
+    
+    Missing values become None (empty cells) like to_excel writes them;
+    only the columns that actually contain missing values are converted.
+    """
+    columns = []
+    for _, column in data.items():
+        if column.hasnans:
+            column = column.astype(object).where(column.notna(), None)
+        columns.append(column)
+    return zip(*columns)
+
+
+def _downcast_numeric(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink numeric columns to the smallest dtype that holds their values.
+    
+    int64 columns drop to int8/16/32 and float64 to float32 where possible,
+    roughly halving memory for the steps that follow. float32 keeps about 7
+    significant digits.
+    """
+    for column in data.select_dtypes('integer').columns:
+        data[column] = pd.to_numeric(data[column], downcast='integer')
+    for column in data.select_dtypes('float').columns:
+        data[column] = pd.to_numeric(data[column], downcast='float')
+    return data
 
 
 class CSVExcelHandler:
@@ -21,31 +136,62 @@ class CSVExcelHandler:
         """Initialize the handler."""
         self.current_data: Optional[pd.DataFrame] = None
         self.current_file: Optional[str] = None
+        # Open workbooks by path, with the mtime and engine they were parsed with,
+        # in LRU order and capped at EXCEL_FILE_CACHE_SIZE entries
+        self._excel_file_cache: 'OrderedDict[str, Tuple[int, Optional[str], pd.ExcelFile]]' = OrderedDict()
+    
+    @staticmethod
+    def _csv_read_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge caller arguments over the default pd.read_csv parameters."""
+        csv_params = {
+            'encoding': 'utf-8',
+            'na_values': ['', 'NULL', 'null', 'None'],
+            'keep_default_na': True
+        }
+        csv_params.update(kwargs)
+        return csv_params
     
-    def read_csv(self, file_path: str, **kwargs) -> pd.DataFrame:
+    def read_csv(self, file_path: str, chunksize: Optional[int] = None,
+                 usecols: Optional[List[str]] = None, downcast: bool = False,
+                 dtype: Optional[Dict[str, str]] = None, **kwargs) -> pd.DataFrame:
         """
         Read data from a CSV file.
         
         Args:
             file_path (str): Path to CSV file
-            **kwargs: Additional arguments for pd.read_csv
+            chunksize (int): Parse this many rows at a time and concatenate,
+                which keeps pandas' parser buffers to one chunk
+            usecols (List[str]): Only keep these columns
+            downcast (bool): Shrink numeric columns to smaller dtypes
+            dtype (Dict[str, str]): Known column dtypes, which skips type
+                inference; see sniff_schema and sample_data.schema.json
+            **kwargs: Additional arguments for pd.read_csv; engine='pyarrow'
+                parses with Arrow's multi-threaded reader (it infers dates
+                and rejects some options, so it is never picked by default)
             
         Returns:
             pd.DataFrame: Loaded data
         """
         try:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"CSV file not found: {file_path}")
+            csv_params = self._csv_read_params(kwargs)
+            if usecols is not None:
+                csv_params['usecols'] = usecols
+            if dtype is not None:
+                csv_params['dtype'] = dtype
             
-            # Default parameters
-            csv_params = {
-                'encoding': 'utf-8',
-                'na_values': ['', 'NULL', 'null', 'None'],
-                'keep_default_na': True
-            }
-            csv_params.update(kwargs)
+            try:
+                handle = _open_csv(file_path)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"CSV file not found: {file_path}") from e
             
-            data = pd.read_csv(file_path, **csv_params)
+            with handle as source:
+                if chunksize:
+                    with pd.read_csv(source, chunksize=chunksize, **csv_params) as reader:
+                        data = pd.concat(reader, ignore_index=True, copy=False)
+                else:
+                    data = pd.read_csv(source, **csv_params)
+            if downcast:
+                data = _downcast_numeric(data)
             self.current_data = data
             self.current_file = file_path
             
@@ -58,22 +204,64 @@ class CSVExcelHandler:
             print(f"❌ Error reading CSV file: {e}")
             raise
     
-    def read_excel(self, file_path: str, sheet_name: str = 0, **kwargs) -> pd.DataFrame:
+    def sniff_schema(self, file_path: str, nrows: int = 1000) -> Dict[str, str]:
+        """
+        Infer column dtypes from the first rows of a CSV file.
+        
+        Pass the result to read_csv(dtype=...) for later reads of the same
+        kind of file. Columns whose first rows are all whole numbers come
+        back as int64, so check them if later rows may hold gaps.
+        
+        Args:
+            file_path (str): Path to CSV file
+            nrows (int): Rows to sample
+            
+        Returns:
+            Dict[str, str]: Column name to dtype name
+        """
+        with _open_csv(file_path) as handle:
+            sample = pd.read_csv(handle, nrows=nrows, **self._csv_read_params({}))
+        return {column: str(dtype) for column, dtype in sample.dtypes.items()}
+    
+    def iter_csv(self, file_path: str, chunksize: int = CSV_CHUNK_ROWS,
+                 **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Stream a CSV file as DataFrame chunks without loading all of it.
+        
+        Unlike read_csv, this does not touch current_data.
+        
+        Args:
+            file_path (str): Path to CSV file
+            chunksize (int): Rows per chunk
+            **kwargs: Additional arguments for pd.read_csv
+            
+        Yields:
+            pd.DataFrame: Consecutive chunks of the file
+        """
+        csv_params = self._csv_read_params(kwargs)
+        with _open_csv(file_path) as handle, \
+                pd.read_csv(handle, chunksize=chunksize, **csv_params) as reader:
+            yield from reader
+    
+    def read_excel(self, file_path: str, sheet_name: str = 0,
+                   usecols: Optional[List[str]] = None, downcast: bool = False,
+                   **kwargs) -> pd.DataFrame:
         """
         Read data from an Excel file.
         
         Args:
             file_path (str): Path to Excel file
-            sheet_name (str): Sheet name or index
+            sheet_name (str): Sheet name or index; None reads every sheet
+            usecols (List[str]): Only keep these columns (the calamine engine
+                skips the others while parsing)
+            downcast (bool): Shrink numeric columns to smaller dtypes
             **kwargs: Additional arguments for pd.read_excel
             
         Returns:
-            pd.DataFrame: Loaded data
+            pd.DataFrame: Loaded data, or a dict of sheet name to DataFrame
+            when sheet_name is None (not kept as current_data)
         """
         try:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Excel file not found: {file_path}")
-            
             # Default parameters
             excel_params = {
                 'sheet_name': sheet_name,
@@ -81,8 +269,30 @@ class CSVExcelHandler:
                 'keep_default_na': True
             }
             excel_params.update(kwargs)
+            if usecols is not None:
+                excel_params['usecols'] = usecols
+            engine = excel_params.pop('engine', EXCEL_READ_ENGINE)
             
-            data = pd.read_excel(file_path, **excel_params)
+            try:
+                excel_file = self._excel_file(file_path, engine)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Excel file not found: {file_path}") from e
+            
+            if sheet_name is None:
+                # Every sheet from the one open workbook, unzipped and parsed once
+                sheets = excel_file.parse(**excel_params)
+                if downcast:
+                    sheets = {name: _downcast_numeric(frame) for name, frame in sheets.items()}
+                self.current_file = file_path
+                
+                print(f"✅ Successfully read Excel file: {file_path}")
+                print(f"📊 Sheets: {len(sheets)}, "
+                      f"{sum(len(frame) for frame in sheets.values())} rows in total")
+                return sheets
+            
+            data = excel_file.parse(**excel_params)
+            if downcast:
+                data = _downcast_numeric(data)
             self.current_data = data
             self.current_file = file_path
             
@@ -95,8 +305,77 @@ class CSVExcelHandler:
             print(f"❌ Error reading Excel file: {e}")
             raise
     
+    def peek_excel(self, file_path: str, sheet_name: str = 0, n: int = 5) -> pd.DataFrame:
+        """
+        Show the first rows of an .xlsx sheet without loading the whole sheet.
+        
+        openpyxl's read-only mode streams rows from the sheet XML, so only
+        the header and n rows are ever parsed. current_data is left alone.
+        
+        Args:
+            file_path (str): Path to .xlsx file
+            sheet_name (str): Sheet name or index
+            n (int): Number of data rows to show
+            
+        Returns:
+            pd.DataFrame: The first n rows
+        """
+        from openpyxl import load_workbook
+        
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+            rows = ws.iter_rows(max_row=n + 1, values_only=True)
+            header = next(rows, ())
+            data = pd.DataFrame(list(islice(rows, n)), columns=header)
+            total_rows = ws.max_row
+        finally:
+            wb.close()
+        
+        print(f"\n📋 First {len(data)} rows of {ws.title}"
+              + (f" ({total_rows - 1} data rows in sheet):" if total_rows else ":"))
+        print(data)
+        return data
+    
+    def _excel_file(self, file_path: str, engine: Optional[str]) -> pd.ExcelFile:
+        """
+        Return a parsed workbook, reusing it while the file is unchanged.
+        
+        Opening an ExcelFile inflates the zip and parses the workbook and
+        shared strings once; later sheets are then read from it directly.
+        
+        Args:
+            file_path (str): Path to Excel file
+            engine (str): Reader engine, or None for pandas' default
+            
+        Returns:
+            pd.ExcelFile: Open workbook
+        """
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = self._excel_file_cache.get(file_path)
+        if cached is not None:
+            cached_mtime, cached_engine, excel_file = cached
+            if cached_mtime == mtime and cached_engine == engine:
+                self._excel_file_cache.move_to_end(file_path)
+                return excel_file
+            self._close_excel_file(file_path)
+        
+        excel_file = pd.ExcelFile(file_path, engine=engine)
+        self._excel_file_cache[file_path] = (mtime, engine, excel_file)
+        if len(self._excel_file_cache) > EXCEL_FILE_CACHE_SIZE:
+            _, (_, _, oldest) = self._excel_file_cache.popitem(last=False)
+            oldest.close()
+        return excel_file
+    
+    def _close_excel_file(self, file_path: str) -> None:
+        """Close and forget the cached workbook for a path, if any."""
+        cached = self._excel_file_cache.pop(file_path, None)
+        if cached is not None:
+            cached[2].close()
+    
     def write_excel(self, data: pd.DataFrame, file_path: str, 
-                   sheet_name: str = 'Sheet1', **kwargs) -> None:
+                   sheet_name: str = 'Sheet1', low_memory: bool = False,
+                   **kwargs) -> None:
         """
         Write data to an Excel file.
         
@@ -104,18 +383,49 @@ class CSVExcelHandler:
             data (pd.DataFrame): Data to write
             file_path (str): Output file path
             sheet_name (str): Sheet name
+            low_memory (bool): Write row by row with xlsxwriter's
+                constant_memory mode (no extra to_excel arguments allowed)
             **kwargs: Additional arguments for to_excel
+        
+        Plain writes stream rows through an openpyxl write-only workbook, so
+        memory stays flat and no Cell objects are built. Passing any extra
+        to_excel arguments (another engine, index, startrow, ...) falls back
+        to DataFrame.to_excel.
+        
+        constant_memory flushes each row to disk as soon as the next one
+        starts, so the rows are written in row order here rather than through
+        to_excel, which fills the sheet column by column.
         """
         try:
-            # Default parameters
-            excel_params = {
-                'index': False,
-                'sheet_name': sheet_name,
-                'engine': 'openpyxl'
-            }
-            excel_params.update(kwargs)
+            # An open handle on the old file would block overwriting it on Windows
+            self._close_excel_file(file_path)
             
-            data.to_excel(file_path, **excel_params)
+            if low_memory:
+                if kwargs:
+                    raise ValueError(f"low_memory doesn't support extra arguments: {sorted(kwargs)}")
+                self._write_xlsx_stream(file_path, sheet_name,
+                                        list(map(str, data.columns)), _excel_rows(data))
+            elif kwargs.get('engine', 'openpyxl') == 'openpyxl' and set(kwargs) <= {'engine'}:
+                from openpyxl import Workbook
+                
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet(sheet_name)
+                ws.append(list(map(str, data.columns)))
+                for row in _excel_rows(data):
+                    ws.append(row)
+                with _open_buffered(file_path, 'wb') as handle:
+                    wb.save(handle)
+            else:
+                # Default parameters
+                excel_params = {
+                    'index': False,
+                    'sheet_name': sheet_name,
+                    'engine': 'openpyxl'
+                }
+                excel_params.update(kwargs)
+                
+                with _open_buffered(file_path, 'wb') as handle:
+                    data.to_excel(handle, **excel_params)
             
             print(f"✅ Successfully wrote Excel file: {file_path}")
             print(f"📊 Wrote {data.shape[0]} rows and {data.shape[1]} columns")
@@ -131,17 +441,29 @@ class CSVExcelHandler:
         Args:
             data (pd.DataFrame): Data to write
             file_path (str): Output file path
-            **kwargs: Additional arguments for to_csv
+            **kwargs: Additional arguments for to_csv; engine='pyarrow'
+                writes with pyarrow.csv instead (no other arguments allowed)
         """
         try:
-            # Default parameters
-            csv_params = {
-                'index': False,
-                'encoding': 'utf-8'
-            }
-            csv_params.update(kwargs)
+            engine = kwargs.pop('engine', None)
             
-            data.to_csv(file_path, **csv_params)
+            compressed = str(file_path).lower().endswith(_COMPRESSED_SUFFIXES)
+            
+            if engine == 'pyarrow' and pa_csv is not None and not kwargs and not compressed:
+                # Arrow's writer is multi-threaded but always quotes strings
+                table = pa.Table.from_pandas(data, preserve_index=False)
+                with _open_buffered(file_path, 'wb') as handle:
+                    pa_csv.write_csv(table, handle)
+            else:
+                # Default parameters
+                csv_params = {
+                    'index': False,
+                    'encoding': 'utf-8'
+                }
+                csv_params.update(kwargs)
+                
+                with _open_csv(file_path, 'wb') as handle:
+                    data.to_csv(handle, **csv_params)
             
             print(f"✅ Successfully wrote CSV file: {file_path}")
             print(f"📊 Wrote {data.shape[0]} rows and {data.shape[1]} columns")
@@ -150,23 +472,188 @@ class CSVExcelHandler:
             print(f"❌ Error writing CSV file: {e}")
             raise
     
-    def csv_to_excel(self, csv_path: str, excel_path: str, **kwargs) -> None:
+    def csv_to_excel(self, csv_path: str, excel_path: str,
+                     dedup_on: Optional[List[str]] = None,
+                     **kwargs) -> Optional[Callable[[pd.DataFrame], pd.DataFrame]]:
         """
         Convert CSV file to Excel file.
         
+        When the Excel file feeds expensive per-row work (API calls, model
+        prompts, ...), dedup_on writes only one row per distinct key. With a
+        low-cardinality key, e.g. a review_type column holding two values,
+        that can cut the rows to process several times over. Run the work
+        on the Excel rows, then pass the results (key columns plus new
+        columns) to the returned function to spread them back over every
+        original row.
+        
         Args:
             csv_path (str): Input CSV file path
             excel_path (str): Output Excel file path
+            dedup_on (List[str]): Key columns to deduplicate on before writing
             **kwargs: Additional arguments
+            
+        Returns:
+            Callable or None: With dedup_on, a function mapping per-key results
+            to a DataFrame of all original rows (left join on the keys)
         """
         print(f"🔄 Converting CSV to Excel...")
         print(f"📁 Input: {csv_path}")
         print(f"📁 Output: {excel_path}")
         
+        if not dedup_on and not kwargs:
+            # Pure format conversion: stream rows, never build a DataFrame
+            rows, columns = self._stream_csv_to_xlsx(csv_path, excel_path)
+            print(f"✅ Successfully wrote Excel file: {excel_path}")
+            print(f"📊 Wrote {rows} rows and {columns} columns")
+            print("✅ Conversion completed successfully!")
+            return None
+        
         data = self.read_csv(csv_path)
-        self.write_excel(data, excel_path, **kwargs)
+        
+        if not dedup_on:
+            self.write_excel(data, excel_path, **kwargs)
+            print("✅ Conversion completed successfully!")
+            return None
+        
+        unique = data.drop_duplicates(subset=dedup_on, ignore_index=True)
+        print(f"🔑 {len(unique)} unique rows on {dedup_on} (from {len(data)})")
+        self.write_excel(unique, excel_path, **kwargs)
+        
+        def expand(results: pd.DataFrame) -> pd.DataFrame:
+            """Broadcast per-key results back onto every original row."""
+            return data.merge(results, on=dedup_on, how='left')
         
         print("✅ Conversion completed successfully!")
+        return expand
+    
+    def _stream_csv_to_xlsx(self, csv_path: str, xlsx_path: str,
+                            sheet_name: str = 'Sheet1') -> Tuple[int, int]:
+        """
+        Copy a CSV file into an XLSX sheet one batch at a time.
+        
+        Rows come from pyarrow's streaming CSV reader (or pandas chunks
+        without pyarrow) and go straight into an xlsxwriter constant_memory
+        sheet, so memory stays at one batch. current_data is left alone.
+        
+        Args:
+            csv_path (str): Input CSV file path
+            xlsx_path (str): Output Excel file path
+            sheet_name (str): Sheet name
+            
+        Returns:
+            Tuple[int, int]: Rows and columns written
+        """
+        self._close_excel_file(xlsx_path)
+        
+        if pa_csv is not None:
+            try:
+                header, rows = self._arrow_csv_rows(csv_path)
+                return self._write_xlsx_stream(xlsx_path, sheet_name, header, rows), len(header)
+            except pa.ArrowInvalid:
+                # A later block didn't fit the types inferred from the first one
+                print("⚠️  Mixed column types; converting with pandas instead")
+        
+        chunks = self.iter_csv(csv_path)
+        first = next(chunks, None)
+        if first is None:
+            return self._write_xlsx_stream(xlsx_path, sheet_name, [], ()), 0
+        header = list(map(str, first.columns))
+        rows = chain.from_iterable(map(_excel_rows, chain((first,), chunks)))
+        return self._write_xlsx_stream(xlsx_path, sheet_name, header, rows), len(header)
+    
+    @staticmethod
+    def _arrow_csv_rows(csv_path: str) -> Tuple[List[str], Iterator[Tuple]]:
+        """Open a pyarrow CSV stream and return its header and a row iterator."""
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+        convert_options.null_values = [*convert_options.null_values, 'None']
+        reader = pa_csv.open_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=16 * IO_BUFFER_SIZE),
+            convert_options=convert_options
+        )
+        
+        def rows() -> Iterator[Tuple]:
+            for batch in reader:
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+        
+        return reader.schema.names, rows()
+    
+    @staticmethod
+    def _write_xlsx_stream(xlsx_path: str, sheet_name: str,
+                           header: List[str], rows) -> int:
+        """
+        Write a header and rows to a constant_memory xlsxwriter sheet.
+        
+        Dates and datetimes get the same number formats as to_excel writes,
+        timezone-aware datetimes are stored as their local time, and NaN or
+        infinite floats become Excel error cells rather than failing.
+        
+        Raises:
+            ValueError: If the data doesn't fit in a sheet (1,048,576 rows
+                by 16,384 columns) or a string is longer than an Excel cell
+                allows (32,767 characters)
+        """
+        import xlsxwriter
+        
+        workbook = xlsxwriter.Workbook(xlsx_path, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'remove_timezone': True,
+            'nan_inf_to_errors': True
+        })
+        try:
+            worksheet = workbook.add_worksheet(sheet_name)
+            # Plain dates (no time part) are shown without 00:00:00
+            date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+            worksheet.add_write_handler(
+                datetime.date,
+                lambda sheet, row, col, value, *args: sheet.write_datetime(row, col, value, date_format)
+            )
+            
+            # write_row returns a negative code instead of raising, and skips
+            # the rest of the row: -1 for a cell out of range, -2 for a long string
+            if worksheet.write_row(0, 0, header) < 0:
+                raise ValueError(f"Too many columns for an Excel sheet: {len(header)}")
+            count = 0
+            for count, row in enumerate(rows, 1):
+                error = worksheet.write_row(count, 0, row)
+                if error == -2:
+                    raise ValueError(
+                        f"Row {count + 1} has a string longer than Excel's "
+                        f"limit of 32,767 characters"
+                    )
+                if error < 0:
+                    raise ValueError(
+                        f"Data doesn't fit in an Excel sheet: row {count + 1} is past "
+                        f"the limit of 1,048,576 rows and 16,384 columns"
+                    )
+        finally:
+            workbook.close()
+        return count
+    
+    def csv_to_parquet(self, csv_path: str, parquet_path: str,
+                       compression: str = 'zstd', **kwargs) -> None:
+        """
+        Convert CSV file to a compressed Parquet file.
+        
+        Parquet is columnar and compressed, so for large data it is much
+        smaller and faster to write and read back than Excel.
+        
+        Args:
+            csv_path (str): Input CSV file path
+            parquet_path (str): Output Parquet file path
+            compression (str): Parquet compression codec
+            **kwargs: Additional arguments for to_parquet
+        """
+        print(f"🔄 Converting CSV to Parquet...")
+        print(f"📁 Input: {csv_path}")
+        print(f"📁 Output: {parquet_path}")
+        
+        data = self.read_csv(csv_path)
+        data.to_parquet(parquet_path, compression=compression, index=False, **kwargs)
+        
+        print(f"✅ Successfully wrote Parquet file: {parquet_path}")
+        print("✅ Conversion completed successfully!")
     
     def excel_to_csv(self, excel_path: str, csv_path: str, 
                     sheet_name: str = 0, **kwargs) -> None:
@@ -199,10 +686,15 @@ class CSVExcelHandler:
         
         print("\n📊 Data Information:")
         print("=" * 50)
-        print(f"Shape: {data.shape[0]} rows × {data.shape[1]} columns")
-        print(f"Columns: {list(data.columns)}")
-        print(f"Data types:\n{data.dtypes}")
-        print(f"Missing values:\n{data.isnull().sum()}")
+        # One pass for shape, dtypes and non-null counts; memory is measured
+        # once here and used for both the summary line and the usecols hint
+        data.info(memory_usage=False, show_counts=True)
+        memory = data.memory_usage(deep=True).sum()
+        print(f"memory usage: {memory / 1024 ** 2:.1f} MB")
+        
+        if memory > USECOLS_HINT_BYTES:
+            print(f"💡 This data uses {memory / 1024 ** 2:.0f} MB; pass usecols=[...] "
+                  f"when reading to load only the columns you need")
         
         print("\n📋 First 5 rows:")
         print(data.head())
@@ -211,47 +703,70 @@ class CSVExcelHandler:
             print("\n📋 Last 5 rows:")
             print(data.tail())
     
-    def clean_data(self, data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    def clean_data(self, data: Optional[pd.DataFrame] = None,
+                   subset: Optional[List[str]] = None, keep: str = 'first') -> pd.DataFrame:
         """
         Clean the data by handling missing values and duplicates.
         
         Args:
             data (pd.DataFrame): Data to clean
+            subset (List[str]): Key columns that identify a duplicate row;
+                hashing only these is cheaper than hashing every column
+            keep (str): Which duplicate to keep ('first', 'last' or False)
             
         Returns:
             pd.DataFrame: Cleaned data
         """
+        # No defensive copy needed: every step below returns a new frame,
+        # and Copy-on-Write (scoped below) keeps the caller's data untouched
         if data is None:
-            data = self.current_data.copy()
-        else:
-            data = data.copy()
+            data = self.current_data
         
         print("🧹 Cleaning data...")
         
-        # Remove duplicates
-        initial_rows = len(data)
-        data = data.drop_duplicates()
-        duplicates_removed = initial_rows - len(data)
-        
-        if duplicates_removed > 0:
-            print(f"🗑️  Removed {duplicates_removed} duplicate rows")
-        
-        # Handle missing values
-        missing_info = data.isnull().sum()
-        if missing_info.sum() > 0:
-            print("🔧 Handling missing values...")
-            for column in data.columns:
-                if missing_info[column] > 0:
-                    if data[column].dtype in ['int64', 'float64']:
-                        # Fill numeric columns with median
-                        data[column].fillna(data[column].median(), inplace=True)
+        # Copy-on-Write only for this method, not for the rest of the process:
+        # derived frames share memory until one of them is modified
+        with pd.option_context('mode.copy_on_write', True):
+            # Remove duplicates
+            initial_rows = len(data)
+            data = data.drop_duplicates(subset=subset, keep=keep, ignore_index=True)
+            duplicates_removed = initial_rows - len(data)
+            
+            if duplicates_removed > 0:
+                print(f"🗑️  Removed {duplicates_removed} duplicate rows")
+            
+            # Handle missing values
+            missing_info = data.isnull().sum()
+            if missing_info.sum() > 0:
+                print("🔧 Handling missing values...")
+                missing_cols = missing_info.index[missing_info > 0]
+                num_cols = data[missing_cols].select_dtypes('number').columns
+                obj_cols = missing_cols.difference(num_cols, sort=False)
+                
+                # Numeric columns get their median, text columns their mode or 'Unknown'
+                median_cols = num_cols
+                if _median_fill is not None:
+                    float_cols = [c for c in num_cols if data.dtypes[c] == 'float64']
+                    for column in float_cols:
+                        data[column] = _median_fill(data[column].to_numpy())
+                    median_cols = num_cols.difference(float_cols, sort=False)
+                
+                fill = data[median_cols].median().to_dict()
+                if len(obj_cols):
+                    modes = data[obj_cols].mode(dropna=True)
+                    first_modes = (modes.iloc[0] if len(modes)
+                                   else pd.Series(index=obj_cols, dtype=object))
+                    fill.update({column: mode_val if pd.notna(mode_val) else 'Unknown'
+                                 for column, mode_val in first_modes.items()})
+                
+                # One fillna over the whole frame instead of one per column
+                data = data.fillna(fill)
+                
+                for column in missing_cols:
+                    if column in num_cols:
                         print(f"   📊 {column}: filled with median")
                     else:
-                        # Fill text columns with mode or 'Unknown'
-                        mode_val = data[column].mode()
-                        fill_val = mode_val[0] if len(mode_val) > 0 else 'Unknown'
-                        data[column].fillna(fill_val, inplace=True)
-                        print(f"   📝 {column}: filled with '{fill_val}'")
+                        print(f"   📝 {column}: filled with '{fill[column]}'")
         
         print("✅ Data cleaning completed!")
         return data
@@ -299,7 +814,14 @@ def create_sample_data():
     df = pd.DataFrame(sample_data)
     df.to_csv('sample_data.csv', index=False)
     
+    # Companion schema so the file can be re-read without type inference
+    schema = {column: str(dtype) for column, dtype in df.dtypes.items()}
+    with open('sample_data.schema.json', 'w', encoding='utf-8') as f:
+        json.dump(schema, f, indent=2)
+    
     print("✅ Created sample_data.csv with employee data")
+    print("🗂️  Schema saved to sample_data.schema.json "
+          "(load it and pass as read_csv(..., dtype=schema))")
     print("📋 Sample data:")
     print(df)
 
@@ -318,14 +840,17 @@ def interactive_mode():
         print("4. 🧹 Clean Data")
         print("5. 📊 Create Sample Data")
         print("6. 🔄 Simple Convert (original code)")
-        print("7. 🚪 Exit")
+        print("7. 🗜️  Convert CSV to Parquet (faster, smaller)")
+        print("8. 🚪 Exit")
         print("-" * 50)
         
-        choice = input("Enter your choice (1-7): ").strip()
+        choice = input("Enter your choice (1-8): ").strip()
         
         try:
             if choice == '1':
                 csv_path = input("Enter CSV file path: ").strip()
+                if os.path.isfile(csv_path) and os.path.getsize(csv_path) > PARQUET_HINT_BYTES:
+                    print("💡 This is a large file; option 7 (Parquet) is much faster and smaller than Excel.")
                 excel_path = input("Enter output Excel file path: ").strip()
                 
                 if not excel_path.endswith('.xlsx'):
@@ -354,6 +879,13 @@ def interactive_mode():
                 elif file_path.lower().endswith(('.xlsx', '.xls')):
                     sheet_input = input("Enter sheet name (or press Enter for first sheet): ").strip()
                     sheet_name = sheet_input if sheet_input else 0
+                    
+                    if file_path.lower().endswith('.xlsx'):
+                        peek = input("Quick peek at the first rows only? (y/n): ").strip().lower()
+                        if peek in ['y', 'yes']:
+                            handler.peek_excel(file_path, sheet_name=sheet_name)
+                            continue
+                    
                     data = handler.read_excel(file_path, sheet_name=sheet_name)
                 else:
                     print("❌ Unsupported file format! Use .csv, .xlsx, or .xls")
@@ -386,11 +918,20 @@ def interactive_mode():
                 simple_conversion()
             
             elif choice == '7':
+                csv_path = input("Enter CSV file path: ").strip()
+                parquet_path = input("Enter output Parquet file path: ").strip()
+                
+                if not parquet_path.endswith('.parquet'):
+                    parquet_path += '.parquet'
+                
+                handler.csv_to_parquet(csv_path, parquet_path)
+            
+            elif choice == '8':
                 print("👋 Thank you for using CSV & Excel Handler!")
                 break
             
             else:
-                print("❌ Invalid choice! Please select 1-7.")
+                print("❌ Invalid choice! Please select 1-8.")
         
         except KeyboardInterrupt:
             print("\n👋 Operation cancelled.")
@@ -7,22 +7,311 @@ Author: Task Ninja Python Series
 Project: Week 2 - Data Handling & APIs
 """
 
+import hashlib
 import json
+import logging
+import math
 import os
+import re
 import sys
+from collections import deque
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, Iterator, List, Union, Optional, Tuple
 from datetime import datetime
 
+# Library methods log instead of printing; interactive_mode prints the status lines
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Optional: much faster parsing and serialization
+    orjson = None
+
+try:
+    import ijson
+    # Only stream with the C backend; the pure-Python one is slower than a full parse
+    try:
+        _ijson = ijson.get_backend('yajl2_c')
+    except ImportError:
+        _ijson = None
+except ImportError:  # Optional: streaming parse of very large files
+    ijson = _ijson = None
+
+# Files larger than this are built up item by item with ijson instead of parsed whole
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+try:
+    import msgpack
+except ImportError:  # Optional: binary sidecar cache that skips re-parsing JSON
+    msgpack = None
+
+# Sidecar cache of a parsed file, stored next to it as <file>.mp when
+# JSONParser(sidecar_cache=True) is used
+SIDECAR_SUFFIX = '.mp'
+
+try:
+    import simdjson
+    simdjson.Parser()  # Raises if no SIMD kernel works on this CPU
+    _LAZY_TYPES = (simdjson.Object, simdjson.Array)
+except (ImportError, RuntimeError):  # Optional: lazy SIMD parsing in read_json_lazy
+    simdjson = None
+    _LAZY_TYPES = ()
+
+
+# 19+ digit runs may be integers outside orjson's 64-bit range, which it would
+# turn into floats; such documents are parsed with json (strings can match too,
+# which only costs the speed-up)
+_LONG_DIGITS = re.compile(rb'\d{19}')
+
+# Journal marker for "this key did not exist before the edit"
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _compile_path(path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """
+    Split a dot path once into (key, list index or None) steps.
+    
+    Keys stay strings for dict lookups; the index is precomputed for list
+    steps, so repeated lookups on the same path skip split() and int().
+    """
+    steps = []
+    for key in path.split('.'):
+        try:
+            index = int(key)
+        except ValueError:
+            index = None
+        steps.append((key, index))
+    return tuple(steps)
+
+
+def _step_source(key: str, index: Optional[int]) -> str:
+    """Source for one path step on `c`, picking list index or dict key at run time."""
+    if index is None:
+        return f"c[{key!r}]"
+    return f"(c[{index!r}] if type(c) is list else c[{key!r}])"
+
+
+@lru_cache(maxsize=1024)
+def _compile_getter(path: str):
+    """
+    Generate a getter function specialised for one dot path.
+    
+    Like _compile_setter, the lookups are unrolled into straight-line code
+    with no loop. Any failed step raises; the caller re-walks the path to
+    report which step it was.
+    """
+    lines = ["def getter(c):"]
+    lines += [f"    c = {_step_source(key, index)}" for key, index in _compile_path(path)]
+    lines.append("    return c")
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<getter {path!r}>", "exec"), namespace)
+    return namespace["getter"]
+
+
+@lru_cache(maxsize=1024)
+def _compile_setter(path: str):
+    """
+    Generate a setter function specialised for one dot path.
+    
+    The steps are unrolled into straight-line code, so repeated sets on the
+    same path run no split or loop. The setter never creates missing
+    parents; it raises instead and the caller falls back to the general walk.
+    It returns (container, key, old value) for the undo journal.
+    """
+    *parents, (final_key, final_index) = _compile_path(path)
+    lines = ["def setter(c, v, _missing):"]
+    lines += [f"    c = {_step_source(key, index)}" for key, index in parents]
+    if final_index is None:
+        lines.append(f"    k = {final_key!r}")
+    else:
+        lines.append(f"    k = {final_index!r} if type(c) is list else {final_key!r}")
+    lines += [
+        "    old = c[k] if type(c) is list else c.get(k, _missing)",
+        "    c[k] = v",
+        "    return c, k, old",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<setter {path!r}>", "exec"), namespace)
+    return namespace["setter"]
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when it gives the same result as json.
+    
+    Falls back to json for possible big integers and for input orjson
+    rejects but json accepts (NaN/Infinity, a UTF-8 BOM, UTF-16/32).
+    """
+    if orjson is not None and not _LONG_DIGITS.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)  # bytes in: encoding (and BOM) auto-detected
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data holds a NaN or infinite float anywhere."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        kind = type(obj)
+        if kind is float:
+            if not math.isfinite(obj):
+                return True
+        elif kind is dict:
+            stack.extend(obj.values())
+        elif kind is list or kind is tuple:
+            stack.extend(obj)
+    return False
+
+
+def _path_error(container: Any, key: str, path: str) -> KeyError:
+    """Build the KeyError for a failed step of a dot path."""
+    if isinstance(container, dict):
+        return KeyError(f"Key '{key}' not found in path '{path}'")
+    if isinstance(container, list):
+        return KeyError(f"Invalid array index '{key}' in path '{path}'")
+    return KeyError(f"Cannot access '{key}' in non-dict/list object")
+
+
+def _stream_json(f) -> Any:
+    """
+    Build a large JSON document from a binary file one top-level item at a time.
+    
+    Only the parsed result is held in memory, never the full file text.
+    """
+    head = f.read(64).lstrip()
+    f.seek(0)
+    try:
+        if head[:1] == b'{':
+            return dict(_ijson.kvitems(f, '', use_float=True))
+        if head[:1] == b'[':
+            return list(_ijson.items(f, 'item', use_float=True))
+        return next(_ijson.items(f, '', use_float=True))
+    except (ijson.JSONError, StopIteration) as e:
+        raise json.JSONDecodeError(f"Invalid JSON: {e}", "", 0) from e
+
+
+def _iter_members(data: Any) -> Iterator[Tuple[Tuple[str, ...], str, Any]]:
+    """
+    Yield (parent path components, key, value) for every dict member, in document order.
+    
+    Depth-first walk with an explicit stack. Children are pushed in reverse
+    so members come out in document order. Siblings share one tuple of
+    parent components; no path string is built until _member_path() is
+    called for a match.
+    """
+    stack = [((), None, data)]
+    while stack:
+        parents, key, obj = stack.pop()
+        
+        if type(key) is str:
+            yield parents, key, obj
+        
+        kind = type(obj)
+        if kind is dict or kind is list:
+            child_parents = () if key is None else parents + (str(key),)
+            if kind is dict:
+                stack.extend((child_parents, k, v) for k, v in reversed(list(obj.items())))
+            else:
+                stack.extend((child_parents, i, obj[i]) for i in range(len(obj) - 1, -1, -1))
+
+
+def _member_path(parents: Tuple[str, ...], key: str) -> str:
+    """Join a member's parent components and key into a dot path."""
+    return '.'.join(parents + (key,))
+
+
+def _file_digest(f) -> bytes:
+    """Hash a binary file's contents in 1 MiB blocks, then rewind it."""
+    digest = hashlib.blake2b(digest_size=16)
+    for block in iter(lambda: f.read(1 << 20), b''):
+        digest.update(block)
+    f.seek(0)
+    return digest.digest()
+
+
+def _read_sidecar(file_path: str, digest: bytes) -> Any:
+    """
+    Load the msgpack sidecar of a JSON file if it was made from the same contents.
+    
+    Returns:
+        Any: Cached data, or _MISSING when there is no usable sidecar
+    """
+    try:
+        with open(file_path + SIDECAR_SUFFIX, 'rb') as f:
+            source_digest, data = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+    except (OSError, ValueError, TypeError, msgpack.UnpackException):
+        return _MISSING
+    if source_digest != digest:
+        return _MISSING
+    return data
+
+
+def _write_sidecar(file_path: str, digest: bytes, data: Any) -> None:
+    """Cache parsed data as <file>.mp, tagged with the source's content hash."""
+    try:
+        packed = msgpack.packb([digest, data])
+        with open(file_path + SIDECAR_SUFFIX, 'wb') as f:
+            f.write(packed)
+    except (OSError, TypeError, ValueError, OverflowError):
+        pass  # The cache is best-effort (read-only folder, 128-bit ints, ...)
+
+
+def _validate_records(records: list, fields: Tuple[Tuple[str, type], ...]) -> bool:
+    """
+    Check a list of flat records against {key: type} one column at a time.
+    
+    Each column is pulled out with map(itemgetter) and checked through the
+    set of its value types, so the per-element work runs in C rather than
+    a recursive Python call per field. isinstance semantics are kept
+    (bool values pass for int).
+    """
+    if not all(issubclass(t, dict) for t in set(map(type, records))):
+        return False
+    for key, expected in fields:
+        try:
+            column = list(map(itemgetter(key), records))
+        except KeyError:
+            return False
+        if not all(issubclass(t, expected) for t in set(map(type, column))):
+            return False
+    return True
+
+
+def _materialize(data: Any) -> Any:
+    """Turn a lazy simdjson document into plain dicts/lists (others pass through)."""
+    if isinstance(data, _LAZY_TYPES):
+        return data.as_dict() if isinstance(data, simdjson.Object) else data.as_list()
+    return data
+
 
 class JSONParser:
     """A comprehensive JSON parser and manipulator."""
     
-    def __init__(self):
-        """Initialize the JSON parser."""
+    def __init__(self, sidecar_cache: bool = False):
+        """
+        Initialize the JSON parser.
+        
+        Args:
+            sidecar_cache (bool): Cache each parsed file next to it as
+                <file>.mp (needs msgpack); a file whose contents hash the
+                same as last time is then loaded without re-parsing
+        """
+        self.sidecar_cache = sidecar_cache and msgpack is not None
         self.current_data: Optional[Dict] = None
         self.current_file: Optional[str] = None
-        self.backup_data: Optional[Dict] = None
+        # Inverse edits (op, target, key, old value) since the last load, for undo.
+        # Replaced values are kept by reference, never copied or serialized, so
+        # undo restores the exact objects and costs nothing until something is edited.
+        self._journal: List[Tuple[str, Any, Any, Any]] = []
+        # (parent components, key, lowercased key, lowercased string value or None)
+        # for current_data, built on the first search and dropped whenever the data changes
+        self._search_index: Optional[List[Tuple[Tuple[str, ...], str, str, Optional[str]]]] = None
     
     def read_json(self, file_path: str) -> Dict[str, Any]:
         """
@@ -35,28 +324,85 @@ class JSONParser:
             Dict[str, Any]: Loaded JSON data
         """
         try:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"JSON file not found: {file_path}")
+            try:
+                f = open(file_path, 'rb')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"JSON file not found: {file_path}") from None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with f:
+                source = os.fstat(f.fileno())
+                digest = _file_digest(f) if self.sidecar_cache else None
+                data = _read_sidecar(file_path, digest) if digest is not None else _MISSING
+                
+                if data is not _MISSING:
+                    pass  # Same contents as last parse: skip the JSON tokenizer entirely
+                elif _ijson is not None and source.st_size > STREAM_THRESHOLD_BYTES:
+                    data = _stream_json(f)
+                else:
+                    data = _loads(f.read())
+                    if digest is not None:
+                        _write_sidecar(file_path, digest, data)
             
-            self.current_data = data.copy()  # Keep original
-            self.backup_data = data.copy()   # Backup for undo
+            # No backup copy: undo replays the edit journal instead
+            self.current_data = data
             self.current_file = file_path
+            self._journal = []
+            self._search_index = None
             
-            print(f"✅ Successfully read JSON file: {file_path}")
-            print(f"📊 Contains {len(data)} top-level keys" if isinstance(data, dict) else f"📊 Contains {len(data)} items")
-            
+            logger.info("Read JSON file %s", file_path)
             return data
             
         except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON format: {e}")
+            logger.error("Invalid JSON format in %s: %s", file_path, e)
             raise
         except Exception as e:
-            print(f"❌ Error reading JSON file: {e}")
+            logger.error("Error reading JSON file %s: %s", file_path, e)
             raise
     
+    def iter_items(self, file_path: str, prefix: str = 'item') -> Iterator[Any]:
+        """
+        Stream the values found under an ijson prefix without loading the file.
+        
+        Args:
+            file_path (str): Path to JSON file
+            prefix (str): ijson prefix, e.g. 'item' for top-level array
+                elements or 'users.item' for the elements of "users"
+            
+        Yields:
+            Any: Each matching value
+        """
+        if ijson is None:
+            raise ImportError("iter_items needs ijson: pip install ijson")
+        
+        backend = _ijson if _ijson is not None else ijson
+        with open(file_path, 'rb') as f:
+            yield from backend.items(f, prefix, use_float=True)
+    
+    def read_json_lazy(self, file_path: str) -> Any:
+        """
+        Parse a JSON file into a lazy, read-only simdjson document.
+        
+        Nothing is turned into Python objects until it is accessed, so
+        get_nested_value on the result only builds the value it returns.
+        Without pysimdjson this falls back to a normal parse. The document
+        is not stored as current_data, since it cannot be modified.
+        
+        Args:
+            file_path (str): Path to JSON file
+            
+        Returns:
+            Any: Lazy document (or plain data without pysimdjson)
+        """
+        if simdjson is None:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            return _loads(raw)
+        
+        # Each document stays valid only while its parser is unused, so
+        # every lazy read gets its own parser
+        with open(file_path, 'rb') as f:
+            return simdjson.Parser().parse(f.read())
+    
     def write_json(self, data: Dict[str, Any], file_path: str, 
                   indent: int = 4, sort_keys: bool = False) -> None:
         """
@@ -65,17 +411,37 @@ class JSONParser:
         Args:
             data (Dict[str, Any]): Data to write
             file_path (str): Output file path
-            indent (int): JSON indentation
+            indent (int): JSON indentation (orjson is used for 2 or None,
+                unless the data holds NaN/Infinity, which orjson writes as null)
             sort_keys (bool): Whether to sort keys
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+            encoded = None
+            if orjson is not None and indent in (2, None):
+                option = orjson.OPT_NON_STR_KEYS
+                if indent:
+                    option |= orjson.OPT_INDENT_2
+                if sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                try:
+                    encoded = orjson.dumps(data, option=option)
+                except orjson.JSONEncodeError:
+                    pass  # e.g. integers beyond 64 bits; json handles them
+                # orjson writes NaN/Infinity as null; only look for them if a null was written
+                if encoded is not None and b'null' in encoded and _has_non_finite(data):
+                    encoded = None
+            
+            if encoded is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(encoded)
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
             
-            print(f"✅ Successfully wrote JSON file: {file_path}")
+            logger.info("Wrote JSON file %s", file_path)
             
         except Exception as e:
-            print(f"❌ Error writing JSON file: {e}")
+            logger.error("Error writing JSON file %s: %s", file_path, e)
             raise
     
     def display_json(self, data: Optional[Dict] = None, max_depth: int = 3) -> None:
@@ -93,19 +459,44 @@ class JSONParser:
             print("❌ No JSON data loaded!")
             return
         
+        data = _materialize(data)
+        
         print("\n📋 JSON Content:")
         print("=" * 50)
         try:
-            formatted_json = json.dumps(data, indent=2, ensure_ascii=False)
+            # Encode incrementally, keeping only the first and last 25 lines
+            # rather than building the whole formatted document
+            head: List[str] = []
+            tail: deque = deque(maxlen=25)
+            total = 0
+            partial = ""
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+            
+            for chunk in encoder.iterencode(data):
+                if '\n' not in chunk:
+                    partial += chunk
+                    continue
+                lines = (partial + chunk).split('\n')
+                partial = lines.pop()
+                for line in lines:
+                    if total < 25:
+                        head.append(line)
+                    tail.append(line)
+                    total += 1
+            if total < 25:
+                head.append(partial)
+            tail.append(partial)
+            total += 1
             
             # Limit output if too large
-            lines = formatted_json.split('\n')
-            if len(lines) > 50:
-                print('\n'.join(lines[:25]))
-                print(f"... ({len(lines) - 50} more lines) ...")
-                print('\n'.join(lines[-25:]))
+            if total > 50:
+                print('\n'.join(head))
+                print(f"... ({total - 50} more lines) ...")
+                print('\n'.join(tail))
             else:
-                print(formatted_json)
+                # Short output: the head plus the lines after it, taken from the tail
+                rest = total - len(head)
+                print('\n'.join(head + list(tail)[len(tail) - rest:]))
         except Exception as e:
             print(f"❌ Error displaying JSON: {e}")
     
@@ -120,23 +511,27 @@ class JSONParser:
         Returns:
             Any: Value at the specified path
         """
-        keys = path.split('.')
+        if isinstance(data, _LAZY_TYPES):
+            # JSON Pointer walk: sibling subtrees are never materialized
+            pointer = '/' + '/'.join(key.replace('~', '~0').replace('/', '~1')
+                                     for key in path.split('.'))
+            try:
+                return data.at_pointer(pointer)
+            except (KeyError, IndexError, ValueError, TypeError) as e:
+                raise KeyError(f"Path '{path}' not found") from e
+        
+        try:
+            return _compile_getter(path)(data)
+        except (KeyError, IndexError, TypeError):
+            pass  # Walk again below to name the step that failed
+        
         current = data
         
-        for key in keys:
-            if isinstance(current, dict):
-                if key in current:
-                    current = current[key]
-                else:
-                    raise KeyError(f"Key '{key}' not found in path '{path}'")
-            elif isinstance(current, list):
-                try:
-                    index = int(key)
-                    current = current[index]
-                except (ValueError, IndexError):
-                    raise KeyError(f"Invalid array index '{key}' in path '{path}'")
-            else:
-                raise KeyError(f"Cannot access '{key}' in non-dict/list object")
+        for key, index in _compile_path(path):
+            try:
+                current = current[index] if type(current) is list else current[key]
+            except (KeyError, IndexError, TypeError):
+                raise _path_error(current, key, path) from None
         
         return current
     
@@ -149,35 +544,44 @@ class JSONParser:
             path (str): Path like "users.0.name"
             value (Any): Value to set
         """
-        keys = path.split('.')
+        try:
+            target, key, old = _compile_setter(path)(data, value, _MISSING)
+        except (KeyError, IndexError, TypeError, AttributeError):
+            pass  # Missing parents or a bad step: the walk below creates or reports them
+        else:
+            self._record(data, 'set', target, key, old)
+            return
+        
+        *parents, (final_key, final_index) = _compile_path(path)
         current = data
         
         # Navigate to the parent of the target
-        for key in keys[:-1]:
-            if isinstance(current, dict):
+        for key, index in parents:
+            if type(current) is dict:
+                # Create new dict if key doesn't exist
                 if key not in current:
-                    # Create new dict if key doesn't exist
+                    self._record(data, 'set', current, key, _MISSING)
                     current[key] = {}
                 current = current[key]
-            elif isinstance(current, list):
+            elif type(current) is list:
                 try:
-                    index = int(key)
                     current = current[index]
-                except (ValueError, IndexError):
-                    raise KeyError(f"Invalid array index '{key}' in path '{path}'")
+                except (TypeError, IndexError):
+                    raise KeyError(f"Invalid array index '{key}' in path '{path}'") from None
             else:
                 raise KeyError(f"Cannot navigate through '{key}' in non-dict/list object")
         
         # Set the final value
-        final_key = keys[-1]
-        if isinstance(current, dict):
+        if type(current) is dict:
+            self._record(data, 'set', current, final_key, current.get(final_key, _MISSING))
             current[final_key] = value
-        elif isinstance(current, list):
+        elif type(current) is list:
             try:
-                index = int(final_key)
-                current[index] = value
-            except (ValueError, IndexError):
-                raise KeyError(f"Invalid array index '{final_key}' in path '{path}'")
+                old_value = current[final_index]
+                current[final_index] = value
+                self._record(data, 'set', current, final_index, old_value)
+            except (TypeError, IndexError):
+                raise KeyError(f"Invalid array index '{final_key}' in path '{path}'") from None
         else:
             raise KeyError(f"Cannot set value in non-dict/list object")
     
@@ -189,27 +593,67 @@ class JSONParser:
             data (Dict): JSON data
             path (str): Path like "users.0.name"
         """
-        keys = path.split('.')
+        *parents, (final_key, final_index) = _compile_path(path)
         current = data
         
         # Navigate to the parent of the target
-        for key in keys[:-1]:
-            if isinstance(current, dict):
+        for key, index in parents:
+            if type(current) is dict:
                 current = current[key]
-            elif isinstance(current, list):
-                current = current[int(key)]
+            elif type(current) is list:
+                if index is None:
+                    raise KeyError(f"Invalid array index '{key}' in path '{path}'")
+                current = current[index]
             else:
                 raise KeyError(f"Cannot navigate through '{key}' in path '{path}'")
         
         # Delete the final value
-        final_key = keys[-1]
-        if isinstance(current, dict):
+        if type(current) is dict:
+            self._record(data, 'set', current, final_key, current[final_key])
             del current[final_key]
-        elif isinstance(current, list):
-            current.pop(int(final_key))
+        elif type(current) is list:
+            if final_index is None:
+                raise KeyError(f"Invalid array index '{final_key}' in path '{path}'")
+            if final_index < 0:
+                final_index += len(current)
+            self._record(data, 'insert', current, final_index, current.pop(final_index))
         else:
             raise KeyError(f"Cannot delete from non-dict/list object")
     
+    def _record(self, data: Any, op: str, target: Any, key: Any, old: Any) -> None:
+        """Journal the inverse of an edit, if it was made to the loaded data."""
+        if data is self.current_data:
+            self._journal.append((op, target, key, old))
+            self._search_index = None
+    
+    def replace_data(self, data: Any) -> None:
+        """Swap in new current data (e.g. a merge result), keeping it undoable."""
+        self._journal.append(('attr', self, 'current_data', self.current_data))
+        self.current_data = data
+        self._search_index = None
+    
+    def undo(self) -> int:
+        """
+        Revert every edit made since the data was loaded.
+        
+        Returns:
+            int: Number of edits reverted
+        """
+        count = len(self._journal)
+        if count:
+            self._search_index = None
+        while self._journal:
+            op, target, key, old = self._journal.pop()
+            if op == 'insert':
+                target.insert(key, old)
+            elif op == 'attr':
+                setattr(target, key, old)
+            elif old is _MISSING:
+                del target[key]
+            else:
+                target[key] = old
+        return count
+    
     def search_json(self, data: Optional[Dict] = None, search_term: str = "", 
                    search_keys: bool = True, search_values: bool = True) -> List[str]:
         """
@@ -230,32 +674,64 @@ class JSONParser:
         if data is None:
             return []
         
-        results = []
+        results: deque = deque()  # Grows block by block, never re-copied
         search_term = search_term.lower()
         
-        def recursive_search(obj: Any, path: str = "") -> None:
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    
-                    # Search in keys
-                    if search_keys and search_term in key.lower():
-                        results.append(current_path)
-                    
-                    # Search in values
-                    if search_values and isinstance(value, str) and search_term in value.lower():
-                        results.append(current_path)
-                    
-                    # Recurse into nested structures
-                    recursive_search(value, current_path)
+        if data is self.current_data:
+            # Repeated searches of the loaded data reuse one lowercased index
+            if self._search_index is None:
+                self._search_index = [
+                    (parents, key, key.lower(), value.lower() if type(value) is str else None)
+                    for parents, key, value in _iter_members(_materialize(data))
+                ]
+            for parents, key, key_lower, value in self._search_index:
+                if search_keys and search_term in key_lower:
+                    results.append(_member_path(parents, key))
+                if search_values and value is not None and search_term in value:
+                    results.append(_member_path(parents, key))
+            return list(results)
+        
+        for parents, key, value in _iter_members(_materialize(data)):
+            if search_keys and search_term in key.lower():
+                results.append(_member_path(parents, key))
+            if search_values and type(value) is str and search_term in value.lower():
+                results.append(_member_path(parents, key))
+        return list(results)
+    
+    def load_and_search(self, file_path: str, search_term: str,
+                        search_keys: bool = True, search_values: bool = True) -> List[str]:
+        """
+        Search a JSON file while parsing it, without building the document.
+        
+        Each object's members are checked in an object_pairs_hook as soon as
+        the object is parsed, and the object itself is then dropped. Because
+        objects close from the inside out, only keys are known, not full
+        paths; use read_json() + search_json() when paths are needed.
+        current_data is left untouched.
+        
+        Args:
+            file_path (str): Path to JSON file
+            search_term (str): Term to search for
+            search_keys (bool): Search in keys
+            search_values (bool): Search in values
             
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    current_path = f"{path}.{i}" if path else str(i)
-                    recursive_search(item, current_path)
+        Returns:
+            List[str]: Keys of matching members, innermost objects first
+        """
+        needle = search_term.lower()
+        hits: List[str] = []
+        
+        def check_members(pairs: List[Tuple[str, Any]]) -> None:
+            for key, value in pairs:
+                if search_keys and needle in key.lower():
+                    hits.append(key)
+                if search_values and type(value) is str and needle in value.lower():
+                    hits.append(key)
+            return None  # Discard the object; only the hits are kept
         
-        recursive_search(data)
-        return results
+        with open(file_path, 'rb') as f:
+            json.loads(f.read(), object_pairs_hook=check_members)
+        return hits
     
     def merge_json(self, data1: Dict, data2: Dict, strategy: str = "update") -> Dict:
         """
@@ -269,29 +745,25 @@ class JSONParser:
         Returns:
             Dict: Merged JSON object
         """
+        # {**a, **b} merges in C (dict | dict needs Python 3.9); later keys win
         if strategy == "update":
             # Simple update - data2 overwrites data1
-            result = data1.copy()
-            result.update(data2)
-            return result
+            return {**data1, **data2}
         
         elif strategy == "keep_first":
             # Keep values from data1, only add new keys from data2
-            result = data1.copy()
-            for key, value in data2.items():
-                if key not in result:
-                    result[key] = value
-            return result
+            merged = {**data2, **data1}
+            # Keep data1's key order, then the new keys from data2
+            return {**data1, **merged}
         
         elif strategy == "deep_merge":
             # Deep merge - recursively merge nested objects
             def deep_merge_recursive(d1: Dict, d2: Dict) -> Dict:
-                result = d1.copy()
-                for key, value in d2.items():
-                    if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                        result[key] = deep_merge_recursive(result[key], value)
-                    else:
-                        result[key] = value
+                result = {**d1, **d2}
+                # Only keys present in both can need a recursive merge
+                for key in d1.keys() & d2.keys():
+                    if type(d1[key]) is dict and type(d2[key]) is dict:
+                        result[key] = deep_merge_recursive(d1[key], d2[key])
                 return result
             
             return deep_merge_recursive(data1, data2)
@@ -342,13 +814,24 @@ class JSONParser:
                 # List with expected item type
                 if not isinstance(obj, list):
                     return False
-                return all(validate_recursive(item, schema_part[0]) for item in obj)
+                item_schema = schema_part[0]
+                if (isinstance(item_schema, dict)
+                        and all(isinstance(t, type) for t in item_schema.values())):
+                    # Flat records (e.g. [{"id": int, "name": str}]): column-wise fast path
+                    return _validate_records(obj, tuple(item_schema.items()))
+                return all(validate_recursive(item, item_schema) for item in obj)
             else:
                 return obj == schema_part
         
         return validate_recursive(data, schema)
 
 
+def print_loaded(file_path: str, data: Any) -> None:
+    """Print the status lines for a freshly loaded file."""
+    print(f"✅ Successfully read JSON file: {file_path}")
+    print(f"📊 Contains {len(data)} top-level keys" if isinstance(data, dict) else f"📊 Contains {len(data)} items")
+
+
 def simple_json_operations():
     """Simple JSON operations matching the original code."""
     print("🔄 Simple JSON Operations")
@@ -445,6 +928,7 @@ def interactive_mode():
             if choice == '1':
                 file_path = input("Enter JSON file path: ").strip()
                 data = parser.read_json(file_path)
+                print_loaded(file_path, data)
                 parser.display_json(data)
             
             elif choice == '2':
@@ -479,8 +963,10 @@ def interactive_mode():
                     print(f"🗑️  Deleted {path}")
                 
                 elif mod_choice == '3':
-                    parser.current_data = parser.backup_data.copy()
-                    print("↩️  Changes undone")
+                    if parser.undo():
+                        print("↩️  Changes undone")
+                    else:
+                        print("ℹ️  Nothing to undo")
             
             elif choice == '3':
                 if parser.current_data is None:
@@ -502,8 +988,10 @@ def interactive_mode():
                 file2 = input("Enter second JSON file path: ").strip()
                 
                 data1 = parser.read_json(file1)
+                print_loaded(file1, data1)
                 parser2 = JSONParser()
                 data2 = parser2.read_json(file2)
+                print_loaded(file2, data2)
                 
                 print("\nMerge strategies:")
                 print("1. Update (second overwrites first)")
@@ -515,7 +1003,7 @@ def interactive_mode():
                 strategy = strategies.get(strategy_choice, 'update')
                 
                 merged = parser.merge_json(data1, data2, strategy)
-                parser.current_data = merged
+                parser.replace_data(merged)
                 
                 print(f"✅ Merged with strategy: {strategy}")
                 parser.display_json(merged)
@@ -540,7 +1028,8 @@ def interactive_mode():
                 if not output_path.endswith('.json'):
                     output_path += '.json'
                 
-                parser.write_json(parser.current_data, output_path)
+                parser.write_json(parser.current_data, output_path, indent=2)
+                print(f"✅ Successfully wrote JSON file: {output_path}")
             
             elif choice == '7':
                 create_sample_json()
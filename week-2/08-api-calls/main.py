@@ -11,13 +11,101 @@ Created: 2024
 """
 
 import json
+import math
 import requests
 import os
+import threading
 import time
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import sys
 from urllib.parse import urlparse, urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster response parsing and saving
+    orjson = None
+
+# Every compression urllib3 can decode here: gzip/deflate always, br and zstd
+# when brotli/zstandard are installed (requests decompresses transparently)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+# RandomUser name parts, fetched in one C call per user
+_NAME_PARTS = itemgetter('first', 'last')
+
+# Most GET responses kept for ETag/Last-Modified revalidation (least recently used go first)
+ETAG_CACHE_SIZE = 128
+
+# URL prefixes that _resolve_url passes through untouched
+_ABSOLUTE_SCHEMES = ('http://', 'https://')
+
+# Write buffer for saved files, so even a streamed save stays a few large writes
+IO_BUFFER_SIZE = 1 << 20
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data holds a NaN or infinite float (orjson would write null)."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        kind = type(obj)
+        if kind is float:
+            if not math.isfinite(obj):
+                return True
+        elif kind is dict:
+            stack.extend(obj.values())
+        elif kind is list or kind is tuple:
+            stack.extend(obj)
+    return False
+
+
+def _parse_response(response: requests.Response) -> Any:
+    """
+    Parse a JSON response, with orjson when it accepts the body.
+    
+    Bodies orjson rejects (NaN, non-UTF-8 charsets, ...) go through
+    response.json() as before.
+    
+    Raises:
+        json.JSONDecodeError: If the body is not JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+
+def _parse_body(body: bytes, encoding: Optional[str]) -> Any:
+    """
+    Parse a cached response body the way response.json() would have.
+    
+    Raises:
+        json.JSONDecodeError: If the body is not JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    # Like requests: the declared charset if any, else UTF-8/16/32 detection
+    return json.loads(body.decode(encoding) if encoding else body)
+
+
+@lru_cache(maxsize=512)
+def _resolve_url(base_url: str, endpoint: str) -> str:
+    """Join an endpoint onto a base URL (cached: clients reuse a few endpoints)."""
+    if endpoint.startswith(_ABSOLUTE_SCHEMES):
+        return endpoint
+    return urljoin(base_url, endpoint)
 
 
 class APIClient:
@@ -25,44 +113,101 @@ class APIClient:
     A versatile API client for making HTTP requests and processing responses.
     """
     
-    def __init__(self, base_url: str = "", default_headers: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        base_url: str = "",
+        default_headers: Optional[Dict[str, str]] = None,
+        rate: Optional[float] = None,
+        capacity: int = 1
+    ):
         """
         Initialize the API client.
         
         Args:
             base_url: Base URL for API endpoints
             default_headers: Default headers to include in requests
+            rate: Average requests per second allowed (None for no limit)
+            capacity: Requests that may burst at once before the rate applies
         """
         self.base_url = base_url
         self.session = requests.Session()
         
+        # One keep-alive pool per host, large enough for concurrent requests;
+        # idempotent requests are retried with backoff on transient errors
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            # Hand back the last response once retries run out, so raise_for_status
+            # reports its real status code instead of a bare RetryError
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Set default headers
         default_headers = default_headers or {}
         self.session.headers.update({
             'User-Agent': 'Python-API-Client/1.0',
             'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             **default_headers
         })
         
         self.request_count = 0
-        self.rate_limit = None
+        
+        # GET (url, params) -> (ETag, Last-Modified, body, charset) for conditional
+        # re-requests, in LRU order and capped at ETAG_CACHE_SIZE entries
+        self._etag_cache: 'OrderedDict[Tuple[str, Tuple], Tuple[Optional[str], Optional[str], bytes, Optional[str]]]' = OrderedDict()
+        
+        # Token bucket: refills at `rate` tokens/s up to `capacity`, one per request
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        # Wall-clock time the latest request was let through (or will be, once its wait ends)
         self.last_request_time = 0
     
+    @property
+    def rate_limit(self) -> Optional[float]:
+        """Minimum seconds between requests (None for no limit), as before the token bucket."""
+        return 1 / self.rate if self.rate else None
+    
+    @rate_limit.setter
+    def rate_limit(self, seconds: Optional[float]) -> None:
+        """Limit to one request every `seconds`: a bucket of one refilled at 1/seconds."""
+        with self._lock:
+            self.rate = 1 / seconds if seconds else None
+            self.capacity = 1
+    
     def _handle_rate_limit(self):
-        """Handle rate limiting between requests."""
-        if self.rate_limit:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.rate_limit:
-                time.sleep(self.rate_limit - time_since_last)
+        """
+        Handle rate limiting between requests (token bucket).
         
-        self.last_request_time = time.time()
+        Requests go straight through while tokens remain. Once the bucket
+        is empty, each caller reserves the next token under the lock and
+        sleeps outside it, so concurrent workers queue up at `rate`.
+        """
+        if not self.rate:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+            self.last_request_time = time.time() + wait
+        
+        if wait:
+            time.sleep(wait)
     
     def _build_url(self, endpoint: str) -> str:
         """Build complete URL from base URL and endpoint."""
-        if endpoint.startswith(('http://', 'https://')):
-            return endpoint
-        return urljoin(self.base_url, endpoint)
+        return _resolve_url(self.base_url, endpoint)
     
     def make_request(
         self, 
@@ -95,10 +240,25 @@ class APIClient:
             url = self._build_url(endpoint)
             method = method.upper()
             
-            # Merge headers
-            request_headers = self.session.headers.copy()
-            if headers:
-                request_headers.update(headers)
+            # Only per-request headers; the session merges its own defaults in
+            request_headers = headers or None
+            
+            # Revalidate a cached GET instead of downloading the body again
+            cache_key = cached = None
+            if method == 'GET':
+                cache_key = (url, tuple(sorted((k, str(v)) for k, v in params.items())) if params else ())
+                with self._lock:
+                    cached = self._etag_cache.get(cache_key)
+                    if cached is not None:
+                        self._etag_cache.move_to_end(cache_key)
+                if cached is not None:
+                    etag, last_modified = cached[:2]
+                    validators = {}
+                    if etag:
+                        validators['If-None-Match'] = etag
+                    if last_modified:
+                        validators['If-Modified-Since'] = last_modified
+                    request_headers = {**validators, **(headers or {})}
             
             print(f"🌐 Making {method} request to: {url}")
             
@@ -113,15 +273,36 @@ class APIClient:
                 timeout=timeout
             )
             
-            self.request_count += 1
+            with self._lock:  # fetch_all calls in from several threads
+                self.request_count += 1
             
             # Handle response
-            response.raise_for_status()
+            revalidated = response.status_code == 304 and cached is not None
+            if revalidated:
+                body = cached[2]  # Not modified: reuse the stored body
+            else:
+                response.raise_for_status()
+                body = response.content
             
             try:
-                response_data = response.json()
+                if revalidated:
+                    response_data = _parse_body(body, cached[3])
+                else:
+                    response_data = _parse_response(response)
             except json.JSONDecodeError:
+                if response.encoding is None:
+                    response.encoding = 'utf-8'  # Skip charset guessing over the whole body
                 response_data = {'text': response.text, 'status_code': response.status_code}
+            else:
+                if cache_key is not None and response.status_code == 200:
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if etag or last_modified:
+                        with self._lock:
+                            self._etag_cache[cache_key] = (etag, last_modified, body, response.encoding)
+                            self._etag_cache.move_to_end(cache_key)
+                            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                                self._etag_cache.popitem(last=False)
             
             print(f"✅ Request successful! Status: {response.status_code}")
             return True, response_data
@@ -152,6 +333,25 @@ class APIClient:
         return self.make_request('DELETE', endpoint, **kwargs)
 
 
+@lru_cache(maxsize=256)
+def _compile_fields(fields: Tuple[str, ...]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Split each dotted field name once into its key path."""
+    return tuple((field, tuple(field.split('.'))) for field in fields)
+
+
+def _extract_compiled(data: Dict, compiled: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Dict:
+    """Pull precompiled field paths out of one record (None where missing)."""
+    extracted = {}
+    for field, keys in compiled:
+        value = data
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+            if value is None:
+                break
+        extracted[field] = value
+    return extracted
+
+
 class DataProcessor:
     """
     Process and transform API response data.
@@ -159,23 +359,14 @@ class DataProcessor:
     
     @staticmethod
     def extract_fields(data: Dict, fields: List[str]) -> Dict:
-        """Extract specific fields from data."""
-        extracted = {}
-        for field in fields:
-            if '.' in field:
-                # Handle nested fields
-                keys = field.split('.')
-                value = data
-                for key in keys:
-                    if isinstance(value, dict) and key in value:
-                        value = value[key]
-                    else:
-                        value = None
-                        break
-                extracted[field] = value
-            else:
-                extracted[field] = data.get(field)
-        return extracted
+        """Extract specific fields from data (dotted names reach into nested dicts)."""
+        return _extract_compiled(data, _compile_fields(tuple(fields)))
+    
+    @staticmethod
+    def extract_fields_many(rows: List[Dict], fields: List[str]) -> List[Dict]:
+        """Extract the same fields from every row, splitting the field paths once."""
+        compiled = _compile_fields(tuple(fields))
+        return [_extract_compiled(row, compiled) for row in rows]
     
     @staticmethod
     def filter_data(data: List[Dict], condition: callable) -> List[Dict]:
@@ -190,19 +381,22 @@ class DataProcessor:
     @staticmethod
     def aggregate_data(data: List[Dict], group_by: str, aggregator: str = 'count') -> Dict:
         """Aggregate data by a field."""
+        # count/sum in one pass, without building a list per group
+        if aggregator == 'count':
+            return dict(Counter(item.get(group_by, 'unknown') for item in data))
+        elif aggregator == 'sum':
+            totals = defaultdict(int)  # Starts at 0 like sum(): int values stay ints
+            for item in data:
+                totals[item.get(group_by, 'unknown')] += item.get('value', 0)
+            return dict(totals)
+        
         groups = {}
         for item in data:
             key = item.get(group_by, 'unknown')
             if key not in groups:
                 groups[key] = []
             groups[key].append(item)
-        
-        if aggregator == 'count':
-            return {k: len(v) for k, v in groups.items()}
-        elif aggregator == 'sum':
-            return {k: sum(item.get('value', 0) for item in v) for k, v in groups.items()}
-        else:
-            return groups
+        return groups
 
 
 class APIDataFetcher:
@@ -220,8 +414,29 @@ class APIDataFetcher:
         """Save data to a JSON file."""
         try:
             filepath = os.path.join(self.output_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            # Encode first, then write once (json.dump writes chunk by chunk)
+            payload = None
+            if orjson is not None:
+                try:
+                    # Datetimes and dataclasses go through default=str, as with json
+                    payload = orjson.dumps(
+                        data,
+                        default=str,
+                        option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                | orjson.OPT_PASSTHROUGH_DATETIME
+                                | orjson.OPT_PASSTHROUGH_DATACLASS)
+                    )
+                except orjson.JSONEncodeError:
+                    pass  # e.g. integers beyond 64 bits; json handles them
+                # orjson writes NaN/Infinity as null; only look for them if a null was written
+                if payload is not None and b'null' in payload and _has_non_finite(data):
+                    payload = None
+            
+            if payload is None:
+                payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+            
+            with open(filepath, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(payload)
             print(f"💾 Data saved to {filepath}")
             return True
         except Exception as e:
@@ -238,20 +453,18 @@ class APIDataFetcher:
         )
         
         if success and 'results' in data:
-            users = data['results']
-            
-            # Process user data
-            processed_users = []
-            for user in users:
-                processed_user = {
-                    'full_name': f"{user['name']['first']} {user['name']['last']}",
+            # Process user data straight from the response, no intermediate list
+            processed_users = [
+                {
+                    'full_name': "%s %s" % _NAME_PARTS(user['name']),
                     'email': user['email'],
                     'phone': user['phone'],
                     'city': user['location']['city'],
                     'country': user['location']['country'],
                     'picture': user['picture']['medium']
                 }
-                processed_users.append(processed_user)
+                for user in data['results']
+            ]
             
             result = {
                 'fetched_at': datetime.now().isoformat(),
@@ -287,19 +500,17 @@ class APIDataFetcher:
         )
         
         if success and 'articles' in data:
-            articles = data['articles']
-            
             # Process articles
-            processed_articles = []
-            for article in articles:
-                processed_article = {
+            processed_articles = [
+                {
                     'title': article.get('title'),
                     'description': article.get('description'),
                     'url': article.get('url'),
                     'published_at': article.get('publishedAt'),
                     'source': article.get('source', {}).get('name')
                 }
-                processed_articles.append(processed_article)
+                for article in data['articles']
+            ]
             
             result = {
                 'fetched_at': datetime.now().isoformat(),
@@ -333,15 +544,15 @@ class APIDataFetcher:
         
         if success:
             # Process price data
-            processed_prices = []
-            for coin_id, price_data in data.items():
-                processed_price = {
+            processed_prices = [
+                {
                     'coin': coin_id,
                     'usd_price': price_data.get('usd'),
                     'eur_price': price_data.get('eur'),
                     'change_24h': price_data.get('usd_24h_change')
                 }
-                processed_prices.append(processed_price)
+                for coin_id, price_data in data.items()
+            ]
             
             result = {
                 'fetched_at': datetime.now().isoformat(),
@@ -394,6 +605,42 @@ class APIDataFetcher:
             print("❌ Failed to fetch weather data")
             return {}
     
+    def fetch_all(
+        self,
+        user_count: int = 5,
+        category: str = 'technology',
+        coins: List[str] = None,
+        city: str = 'London'
+    ) -> Dict[str, Dict]:
+        """
+        Fetch users, news, crypto prices and weather at the same time.
+        
+        The four fetches are independent, so they run in parallel threads
+        and the whole batch takes about as long as the slowest API.
+        
+        Returns:
+            Dict mapping 'users', 'news', 'crypto' and 'weather' to each
+            fetcher's result ({} when that fetch failed)
+        """
+        jobs = {
+            'users': (self.fetch_random_users, user_count),
+            'news': (self.fetch_news_headlines, category),
+            'crypto': (self.fetch_crypto_prices, coins),
+            'weather': (self.fetch_weather_data, city),
+        }
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {pool.submit(fetch, arg): name for name, (fetch, arg) in jobs.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"❌ {name} fetch failed: {e}")
+                    results[name] = {}
+        return results
+    
     def make_custom_api_call(self, url: str, method: str = 'GET', params: Dict = None) -> Dict:
         """Make a custom API call to any endpoint."""
         print(f"\n📡 Making custom {method} request to {url}")
@@ -451,6 +698,7 @@ def display_menu():
     print("5. 📡 Custom API Call")
     print("6. 📊 Show Request Statistics")
     print("7. 🗂️ List Saved Data Files")
+    print("8. 🚀 Fetch All (in parallel)")
     print("0. 🚪 Exit")
     print("="*40)
 
@@ -466,7 +714,7 @@ def main():
         display_menu()
         
         try:
-            choice = input("\nEnter your choice (0-7): ").strip()
+            choice = input("\nEnter your choice (0-8): ").strip()
             
             if choice == '0':
                 print("\n👋 Thanks for using API Data Fetcher!")
@@ -562,6 +810,11 @@ def main():
                 except FileNotFoundError:
                     print("Output directory not found.")
             
+            elif choice == '8':
+                results = fetcher.fetch_all()
+                fetched = [name for name, result in results.items() if result]
+                print(f"\n✅ Fetched {len(fetched)}/{len(results)} datasets: {', '.join(sorted(fetched)) or 'none'}")
+            
             else:
                 print("❌ Invalid choice. Please try again.")
         